@@ -5,18 +5,42 @@ This module handles all interactions with Anthropic's Claude API,
 including initialization, error handling, and message processing.
 """
 
-import anthropic  # Anthropic's official SDK for Claude API
-import httpx      # HTTP client library for custom configurations
 import logging    # Standard Python logging for debugging and monitoring
 import os         # Operating system interface for environment variables
+import threading  # Guards singleton creation across threads
 # Type hints for better code documentation
-from typing import Tuple, List, Dict, Any, Optional
+from typing import TYPE_CHECKING, Tuple, List, Dict, Any, Optional, Callable
+
+# Anthropic's SDK is heavy to import, so it is loaded when a client is first created
+if TYPE_CHECKING:
+    import anthropic
+
+# Shared pooled HTTP client so API calls reuse open connections
+from ..utils.http_client import get_http_client
 
 # Set up logger instance for this module
 # Creates logger with module name for identification
 logger = logging.getLogger(__name__)
 
 
+def _cached_system(system_prompt: str) -> List[Dict[str, Any]]:
+    """
+    Wrap the system prompt as a text block marked for Anthropic prompt caching.
+
+    The system prompt is identical on every turn, so the API can reuse its
+    processed prefix for five minutes instead of re-reading it each request.
+    """
+    return [{"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}]
+
+
+def _log_cache_usage(usage: Any) -> None:
+    """Log how much of the prompt was served from or written to the prompt cache."""
+    read = getattr(usage, "cache_read_input_tokens", None)
+    written = getattr(usage, "cache_creation_input_tokens", None)
+    if read is not None or written is not None:
+        logger.info("Prompt cache: %s tokens read, %s tokens written", read or 0, written or 0)
+
+
 class ClaudeClient:
     """
     Client for interacting with Claude API.
@@ -48,12 +72,14 @@ class ClaudeClient:
             # Initialize client if API key is available
             self.client, self.error_message = self._initialize_client()
 
-    def _initialize_client(self) -> Tuple[Optional[anthropic.Anthropic], str]:
+    def _initialize_client(self) -> Tuple[Optional["anthropic.Anthropic"], str]:
         """
         Initialize the Claude client with comprehensive error handling.
 
-        This method handles various initialization scenarios including
-        proxy configuration issues and SDK version differences.
+        The client is built on the shared pooled HTTP client, which also
+        sidesteps the 'proxies' argument mismatch between some SDK and
+        httpx versions. SDK releases that reject an httpx client fall back
+        to their own default client.
 
         Returns:
             Tuple of (client_instance, error_message)
@@ -61,24 +87,20 @@ class ClaudeClient:
             - error_message: Empty string if successful, error description if failed
         """
         try:
+            import anthropic  # Anthropic's official SDK for Claude API
+
             # Log initialization attempt for debugging
             logger.info(
                 "Attempting to initialize Claude client with standard configuration")
 
-            # Try standard initialization first (most common case)
             try:
                 # Return client and empty error string
-                return anthropic.Anthropic(api_key=self.api_key), ""
+                return anthropic.Anthropic(api_key=self.api_key, http_client=get_http_client()), ""
             except TypeError as e:
-                # Handle specific proxy configuration errors in some SDK versions
-                if "unexpected keyword argument 'proxies'" in str(e):
-                    logger.warning(
-                        "Proxy configuration error, attempting alternative initialization")
-                    # Create custom HTTP client to bypass proxy issues
-                    http_client = httpx.Client()
-                    return anthropic.Anthropic(api_key=self.api_key, http_client=http_client), ""
-                else:
-                    raise e  # Re-raise if it's a different TypeError
+                # Some SDK releases bundle their own HTTP stack and refuse httpx clients
+                logger.warning(
+                    f"Shared HTTP client not accepted ({e}), using the SDK default client")
+                return anthropic.Anthropic(api_key=self.api_key), ""
 
         except Exception as e:
             # Catch any other unexpected errors during initialization
@@ -110,7 +132,9 @@ class ClaudeClient:
                           system_prompt: str,              # System instructions for Claude
                           model: str = "claude-sonnet-4-20250514",  # Model version
                           max_tokens: int = 1000,          # Maximum response length
-                          temperature: float = 0) -> Tuple[Optional[str], Optional[str]]:
+                          temperature: float = 0,
+                          # Called with each text delta as it streams in
+                          on_delta: Optional[Callable[[str], None]] = None) -> Tuple[Optional[str], Optional[str]]:
         """
         Generate a response from Claude using the messages API.
 
@@ -121,6 +145,8 @@ class ClaudeClient:
             model: Claude model to use (defaults to claude-3-7-sonnet)
             max_tokens: Maximum tokens in response (controls response length)
             temperature: Randomness parameter (0 = deterministic, 1 = creative)
+            on_delta: Optional callback; when given the response is streamed and
+                     each text delta is passed to it as soon as it arrives
 
         Returns:
             Tuple of (response_text, error_message)
@@ -137,15 +163,31 @@ class ClaudeClient:
                 f"Sending request to Claude API with {len(messages)} messages")
 
             # Check which version of the Anthropic SDK we're using
-            if hasattr(self.client, 'messages'):
+            if hasattr(self.client, 'messages') and on_delta is not None:
+                # Stream the response so callers can act on text before it completes
+                parts = []
+                with self.client.messages.stream(
+                    model=model,
+                    max_tokens=max_tokens,
+                    temperature=temperature,
+                    messages=messages,
+                    system=_cached_system(system_prompt)
+                ) as stream:
+                    for text in stream.text_stream:
+                        parts.append(text)  # Keep the full reply for the return value
+                        on_delta(text)      # Hand the delta on immediately
+                    _log_cache_usage(stream.get_final_message().usage)
+                return "".join(parts), None
+            elif hasattr(self.client, 'messages'):
                 # New SDK version with messages API (preferred method)
                 response = self.client.messages.create(
                     model=model,                    # Specify which Claude model to use
                     max_tokens=max_tokens,          # Limit response length
                     temperature=temperature,        # Control randomness
                     messages=messages,              # Conversation history
-                    system=system_prompt           # System instructions
+                    system=_cached_system(system_prompt)  # System instructions, cached across turns
                 )
+                _log_cache_usage(response.usage)
                 # Extract text from response object
                 result = response.content[0].text
                 return result, None  # Return response and no error
@@ -154,18 +196,19 @@ class ClaudeClient:
                 logger.warning(
                     "Using older Anthropic SDK version with completion API")
 
-                # Convert messages format to older prompt format
-                prompt = ""
+                # Convert messages format to older prompt format, joined once at the end
+                prompt_parts = []
                 for msg in messages:
                     if msg["role"] == "user":
                         # Format user messages
-                        prompt += f"\n\nHuman: {msg['content']}"
+                        prompt_parts.append(f"\n\nHuman: {msg['content']}")
                     elif msg["role"] == "assistant":
                         # Format assistant messages
-                        prompt += f"\n\nAssistant: {msg['content']}"
+                        prompt_parts.append(f"\n\nAssistant: {msg['content']}")
 
                 # Add final assistant prompt for completion
-                prompt += "\n\nAssistant:"
+                prompt_parts.append("\n\nAssistant:")
+                prompt = "".join(prompt_parts)
 
                 # Use older completion API
                 response = self.client.completion(
@@ -184,7 +227,8 @@ class ClaudeClient:
             logger.error(error_msg)  # Log error for debugging
             return None, error_msg   # Return no response and error message
 
-    def get_narrative(self, prompt: str, system_prompt: str, temperature: float = 0) -> Tuple[Optional[str], Optional[str]]:
+    def get_narrative(self, prompt: str, system_prompt: str, temperature: float = 0,
+                      on_delta: Optional[Callable[[str], None]] = None) -> Tuple[Optional[str], Optional[str]]:
         """
         Generate a narrative response for the SootheAI experience.
 
@@ -195,6 +239,7 @@ class ClaudeClient:
             prompt: User prompt to send to Claude
             system_prompt: System prompt with game mechanics and context
             temperature: Randomness parameter (0 = deterministic, 1 = creative)
+            on_delta: Optional callback receiving each streamed text delta
 
         Returns:
             Tuple of (narrative_text, error_message)
@@ -204,11 +249,12 @@ class ClaudeClient:
         # Convert single prompt to messages format
         messages = [{"role": "user", "content": prompt}]
         # Use the main generate_response method with temperature
-        return self.generate_response(messages, system_prompt, temperature=temperature)
+        return self.generate_response(messages, system_prompt, temperature=temperature, on_delta=on_delta)
 
 
 # Singleton pattern implementation for global client access
 _claude_client = None  # Module-level variable to store singleton instance
+_claude_client_lock = threading.Lock()  # Ensures concurrent callers share one client
 
 
 def get_claude_client(api_key: Optional[str] = None) -> ClaudeClient:
@@ -229,7 +275,10 @@ def get_claude_client(api_key: Optional[str] = None) -> ClaudeClient:
 
     # Create client only if it doesn't exist yet
     if _claude_client is None:
-        # Initialize with provided or environment key
-        _claude_client = ClaudeClient(api_key)
+        with _claude_client_lock:
+            # Re-check inside the lock in case another thread created it first
+            if _claude_client is None:
+                # Initialize with provided or environment key
+                _claude_client = ClaudeClient(api_key)
 
     return _claude_client  # Return existing or newly created client
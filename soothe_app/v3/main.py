@@ -6,9 +6,10 @@ an interactive narrative experience with autonomous character generation.
 """
 
 from soothe_app.v3.core.api_client import get_claude_client
-from soothe_app.v3.ui.gradio_interface import create_gradio_interface
+from soothe_app.v3.ui.gradio_interface import get_gradio_interface
 from soothe_app.v3.utils.safety import initialize_content_filter
 from soothe_app.v3.utils.logger import configure_logging
+from soothe_app.v3.utils.http_client import get_http_client
 
 import os
 import sys
@@ -40,7 +41,9 @@ def main():
     if elevenlabs_api_key:
         logger.info("Setting up ElevenLabs client")
         try:
-            elevenlabs_client = ElevenLabs(api_key=elevenlabs_api_key)
+            # Share the pooled HTTP client with the Claude SDK
+            elevenlabs_client = ElevenLabs(
+                api_key=elevenlabs_api_key, httpx_client=get_http_client())
             logger.info("ElevenLabs client initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize ElevenLabs client: {str(e)}")
@@ -59,7 +62,7 @@ def main():
     try:
         # Create and launch the UI without character data
         logger.info("Creating autonomous Gradio interface")
-        interface = create_gradio_interface(elevenlabs_client)  # Remove character_data parameter
+        interface = get_gradio_interface(elevenlabs_client)
 
         # Launch the web interface
         interface.launch(share=True, server_name="0.0.0.0", server_port=7861)
@@ -5,17 +5,23 @@ Manages the state of the narrative experience without character data dependency.
 
 import time
 import logging
-from typing import Dict, List, Tuple, Any, Optional
+from collections import deque
+from typing import Deque, Dict, Tuple, Any, Optional
 
 logger = logging.getLogger(__name__)
 
+# Oldest exchanges are dropped beyond this so long sessions can't grow without bound
+MAX_HISTORY_PAIRS = 50
+
 
 class GameState:
     """Class for managing the state of the SootheAI narrative experience."""
 
     def __init__(self):
         """Initialize the game state without character data dependency."""
-        self.history: List[Tuple[str, str]] = []
+        self.history: Deque[Tuple[str, str]] = deque(maxlen=MAX_HISTORY_PAIRS)
+        # Exchanges ever added, so numbering survives the oldest pairs being dropped
+        self.exchange_count: int = 0
         self.consent_given: bool = False
         self.start_narrative: Optional[str] = None
         self.interaction_count: int = 0
@@ -82,18 +88,28 @@ class GameState:
             assistant_response: Assistant's response
         """
         self.history.append((user_message, assistant_response))
+        self.exchange_count += 1
         logger.debug(
             f"Added message pair to history (now {len(self.history)} pairs)")
 
-    def get_history(self) -> List[Tuple[str, str]]:
+    def get_history(self) -> Deque[Tuple[str, str]]:
         """
         Get the conversation history.
 
         Returns:
-            List of (user_message, assistant_response) tuples
+            Deque of the most recent (user_message, assistant_response) tuples
         """
         return self.history
 
+    def get_exchange_count(self) -> int:
+        """
+        Get the number of exchanges added over the whole session.
+
+        Returns:
+            Total exchanges, including any dropped from the bounded history
+        """
+        return self.exchange_count
+
     def increment_interaction_count(self) -> int:
         """
         Increment the interaction count.
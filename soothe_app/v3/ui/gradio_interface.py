@@ -2,67 +2,211 @@
 Enhanced Gradio interface module for SootheAI with professional chatbot design.
 """
 
+import asyncio
+import functools
+import hashlib
 import logging
-import gradio as gr
-from typing import Optional, Tuple, List, Dict, Any
-# ADD THESE IMPORTS:
+import re
+import threading
+from pathlib import Path
+from string import Template
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Optional, Tuple, List, Dict, Any, AsyncIterator, Callable
 from ..core.api_client import get_claude_client
-from ..utils.safety import check_input_safety, filter_response_safety
-from ..utils.tts_audit_utils import get_tts_statistics, create_tts_report, format_tts_report_for_display
-from ..core.narrative_engine import create_narrative_engine, CONSENT_MESSAGE
-from ..models.game_state import GameState
+from ..utils.safety import filter_response_safety
+from ..utils.minify import minify_css, minify_html
+from ..core.narrative_engine import create_narrative_engine
 from ..ui.tts_handler import get_tts_handler
 
-logger = logging.getLogger(__name__)
-
-
-def process_tts_commands(self, message: str) -> Tuple[bool, Optional[str]]:
-    """Process TTS-related commands."""
-    is_tts_command, tts_response = self.tts_handler.process_command(message)
-    return is_tts_command, tts_response
-
-
-class GradioInterface:
-    """Enhanced Gradio interface for SootheAI with professional chatbot design."""
-
-    def __init__(self, elevenlabs_client=None):
-        # Enhanced color palette with professional design
-        self.colors = {
-            'primary': '#2563eb',        # Rich blue
-            'primary_light': '#3b82f6',  # Lighter blue
-            'primary_dark': '#1d4ed8',   # Darker blue
-            'secondary': '#64748b',      # Slate gray
-            'accent': '#10b981',         # Emerald green
-            'accent_light': '#34d399',   # Light emerald
-            'background': "#83b5e7",     # Very light gray-blue
-            'surface': '#ffffff',        # Pure white
-            'surface_alt': '#f1f5f9',    # Light gray-blue
-            'surface_hover': '#f8fafc',  # Surface hover state
-            'text_primary': '#0f172a',   # Very dark slate
-            'text_secondary': '#334155',  # Medium slate
-            'text_muted': '#64748b',     # Light slate
-            'border': "#a3bcd6",         # Light border
-            'border_light': "#859fba",   # Even lighter border
-            'border_focus': '#3b82f6',   # Blue focus border
-            'success': '#059669',        # Success green
-            'warning': '#d97706',        # Warning orange
-            'error': '#dc2626',          # Error red
-            'gradient_start': '#667eea',  # Gradient start
-            'gradient_end': '#764ba2',   # Gradient end
-            'chat_bg': "#4ea3f8",        # Chat background
-            'user_bubble': '#2563eb',    # User message bubble
-            'bot_bubble': '#334155',     # Bot message bubble
-            'shadow_sm': '0 1px 2px 0 rgba(0, 0, 0, 0.05)',
-        }
+# Gradio (and the FastAPI/Starlette stack under it) is imported only when the UI is built
+if TYPE_CHECKING:
+    import gradio as gr
 
-        self.claude_client = get_claude_client()
-        self.narrative_engine = create_narrative_engine()
-        self.tts_handler = get_tts_handler(elevenlabs_client)
-        self.interface = None
-        self.conversation_history = []
+logger = logging.getLogger(__name__)
 
-        # Enhanced consent message with better formatting
-        self.consent_message = """
+# Enhanced color palette with professional design, read-only and shared by every instance
+_COLORS = MappingProxyType({
+    'primary': '#2563eb',        # Rich blue
+    'primary_light': '#3b82f6',  # Lighter blue
+    'primary_dark': '#1d4ed8',   # Darker blue
+    'secondary': '#64748b',      # Slate gray
+    'accent': '#10b981',         # Emerald green
+    'accent_light': '#34d399',   # Light emerald
+    'background': "#83b5e7",     # Very light gray-blue
+    'surface': '#ffffff',        # Pure white
+    'surface_alt': '#f1f5f9',    # Light gray-blue
+    'surface_hover': '#f8fafc',  # Surface hover state
+    'text_primary': '#0f172a',   # Very dark slate
+    'text_secondary': '#334155',  # Medium slate
+    'text_muted': '#64748b',     # Light slate
+    'border': "#a3bcd6",         # Light border
+    'border_light': "#859fba",   # Even lighter border
+    'border_focus': '#3b82f6',   # Blue focus border
+    'success': '#059669',        # Success green
+    'warning': '#d97706',        # Warning orange
+    'error': '#dc2626',          # Error red
+    'gradient_start': '#667eea',  # Gradient start
+    'gradient_end': '#764ba2',   # Gradient end
+    'chat_bg': "#4ea3f8",        # Chat background
+    'user_bubble': '#2563eb',    # User message bubble
+    'bot_bubble': '#334155',     # Bot message bubble
+    'shadow_sm': '0 1px 2px 0 rgba(0, 0, 0, 0.05)',
+})
+
+# Heading icons as inline SVG, so they render the same everywhere without an emoji font
+_SVG_OPEN = ('<svg class="soothe-icon" width="1em" height="1em" viewBox="0 0 24 24" fill="none" '
+             'stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round" aria-hidden="true">')
+_ICONS = MappingProxyType({name: f"{_SVG_OPEN}{paths}</svg>" for name, paths in {
+    'book': '<path d="M2 3h6a4 4 0 0 1 4 4v14a3 3 0 0 0-3-3H2z"/>'
+            '<path d="M22 3h-6a4 4 0 0 0-4 4v14a3 3 0 0 1 3-3h7z"/>',
+    'lifebuoy': '<circle cx="12" cy="12" r="10"/><circle cx="12" cy="12" r="4"/>'
+                '<path d="m4.93 4.93 4.24 4.24M14.83 9.17l4.24-4.24M14.83 14.83l4.24 4.24M9.17 14.83l-4.24 4.24"/>',
+    'warning': '<path d="m21.73 18-8-14a2 2 0 0 0-3.48 0l-8 14A2 2 0 0 0 4 21h16a2 2 0 0 0 1.73-3"/>'
+               '<path d="M12 9v4M12 17h.01"/>',
+    'bulb': '<path d="M15 14c.2-1 .7-1.7 1.5-2.5 1-.9 1.5-2.2 1.5-3.5A6 6 0 0 0 6 8c0 1 .2 2.2 1.5 3.5.7.7 1.3 1.5 1.5 2.5"/>'
+            '<path d="M9 18h6M10 22h4"/>',
+    'target': '<circle cx="12" cy="12" r="10"/><circle cx="12" cy="12" r="6"/><circle cx="12" cy="12" r="2"/>',
+    'siren': '<path d="M7 18v-6a5 5 0 1 1 10 0v6"/>'
+             '<path d="M5 21a1 1 0 0 0 1 1h12a1 1 0 0 0 1-1v-1a2 2 0 0 0-2-2H7a2 2 0 0 0-2 2z"/>'
+             '<path d="M21 12h1M18.5 4.5 18 5M2 12h1M12 2v1M4.93 4.93l.7.7M12 12v6"/>',
+    'graduate': '<path d="M22 10v6M2 10l10-5 10 5-10 5z"/><path d="M6 12v5c3 3 9 3 12 0v-5"/>',
+}.items()})
+# Template fields for the icons, e.g. ${icon_book}
+_ICON_FIELDS = {f"icon_{name}": svg for name, svg in _ICONS.items()}
+
+# Gradio theme variables resolved from the palette once, rather than per theme build
+_THEME_OVERRIDES = MappingProxyType({
+    'body_background_fill': f"linear-gradient(135deg, {_COLORS['gradient_start']}, {_COLORS['gradient_end']})",
+    'background_fill_primary': _COLORS['background'],
+    'background_fill_secondary': _COLORS['surface_alt'],
+    'block_background_fill': _COLORS['surface'],
+    'input_background_fill': _COLORS['surface'],
+    'button_primary_background_fill': f"linear-gradient(135deg, {_COLORS['primary']}, {_COLORS['primary_light']})",
+    'button_primary_background_fill_hover': f"linear-gradient(135deg, {_COLORS['primary_light']}, {_COLORS['primary']})",
+    'button_primary_text_color': "white",
+    'button_secondary_background_fill': f"linear-gradient(135deg, {_COLORS['accent']}, {_COLORS['accent_light']})",
+    'border_color_primary': _COLORS['border'],
+    'border_color_accent': _COLORS['border_focus'],
+    'body_text_color': _COLORS['text_secondary'],
+    'body_text_color_subdued': _COLORS['text_muted'],
+})
+
+_FONT_IMPORTS = "@import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&family=Space+Grotesk:wght@400;500;600;700&display=swap');"
+
+# Page markup and stylesheet live in the assets directory next to this module
+_ASSETS_DIR = Path(__file__).parent / "assets"
+
+
+def _load_asset(name: str) -> Template:
+    """Read an asset file as a string.Template"""
+    return Template((_ASSETS_DIR / name).read_text(encoding="utf-8"))
+
+
+# The stylesheet has no per-instance values, so it is rendered and minified once at import
+_ENHANCED_CSS = minify_css(_load_asset("theme.css").substitute(
+    _COLORS, font_imports=_FONT_IMPORTS))
+# Info-page card rules are never above the fold, so they load as a separate, cacheable sheet
+_CARDS_CSS = minify_css(_load_asset("cards.css").substitute(_COLORS))
+# Fingerprinted path, so the sheet can be cached forever and a changed sheet gets a new URL
+_CARDS_CSS_PATH = f"/soothe-cards.{hashlib.sha256(_CARDS_CSS.encode()).hexdigest()[:12]}.css"
+_CARDS_CSS_HEAD = (
+    f'<link rel="preload" href="{_CARDS_CSS_PATH}" as="style" '
+    f'onload="this.onload=null;this.rel=\'stylesheet\'">'
+    f'<noscript><link rel="stylesheet" href="{_CARDS_CSS_PATH}"></noscript>'
+)
+# Page buttons name the tab they open in data-target-tab; one delegated listener handles them all
+_TAB_LINK_SCRIPT = (
+    "<script>document.addEventListener('click',function(e){"
+    "var b=e.target.closest&&e.target.closest('[data-target-tab]');"
+    "if(b)document.getElementById(b.dataset.targetTab+'-button').click();});</script>"
+)
+_HOMEPAGE_TEMPLATE = _load_asset("homepage.html")
+_FEATURE_CARD_TEMPLATE = _load_asset("feature_card.html")
+
+# Anxiety education bullets as (term, description)
+_COMMON_SIGNS = (
+    ("Physical", "Racing heart, sweating, difficulty breathing"),
+    ("Emotional", "Persistent worry, irritability, restlessness"),
+    ("Behavioral", "Avoidance, procrastination, perfectionism"),
+    ("Cognitive", "Racing thoughts, difficulty concentrating"),
+)
+_COPING_STRATEGIES = (
+    ("Breathing", "Deep, slow breathing exercises"),
+    ("Mindfulness", "Present-moment awareness practices"),
+    ("Exercise", "Regular physical activity"),
+    ("Support", "Talking to trusted friends or professionals"),
+)
+_BULLET_TEMPLATE = Template("<li><strong>$term:</strong> $description</li>")
+# Education list cards as (variant, icon, title, heading colour, list text colour, items)
+_EDUCATION_LIST_CARDS = (
+    ("signs", "warning", "Common Signs", "#fbbf24", "#fde68a", _COMMON_SIGNS),
+    ("coping", "bulb", "Healthy Coping", "#34d399", "#a7f3d0", _COPING_STRATEGIES),
+)
+_LIST_CARD_TEMPLATE = _load_asset("list_card.html")
+
+# Helpline emergency contacts as (label, number)
+_EMERGENCY_CONTACTS = (
+    ("Emergency", "999"),
+    ("SOS Helpline", "1-767"),
+    ("National Care", "1800-202-6868"),
+)
+_CONTACT_TEMPLATE = Template(
+    '<div class="soothe-contact"><strong>$label</strong><br>'
+    '<span class="soothe-contact-number">$number</span></div>')
+
+
+def _render_bullets(items: Tuple[Tuple[str, str], ...]) -> str:
+    """Render (term, description) pairs as list items"""
+    return "".join([_BULLET_TEMPLATE.substitute(term=term, description=description)
+                    for term, description in items])
+
+
+# Homepage feature cards as (icon, title, description, accent colour)
+_FEATURE_CARDS = (
+    ("📖", "Interactive Stories", "Experience relatable scenarios through AI-powered storytelling", "#3b82f6"),
+    ("🎯", "Personalized Learning", "AI adapts to your choices for a unique learning experience", "#10b981"),
+    ("🤝", "Safe Environment", "Learn anxiety management in a supportive, judgment-free space", "#f59e0b"),
+    ("🇸🇬", "Local Context", "Stories set in familiar Singaporean school environments", "#ef4444"),
+)
+
+# Pages only use the shared palette and the data above, so they are rendered once and returned by reference
+_ANXIETY_EDUCATION_HTML = minify_html(_load_asset("education.html").substitute(
+    _COLORS,
+    **_ICON_FIELDS,
+    list_cards="\n        ".join([
+        _LIST_CARD_TEMPLATE.substitute(variant=variant, icon=_ICONS[icon], title=title,
+                                       accent=accent, text=text, items=_render_bullets(items))
+        for variant, icon, title, accent, text, items in _EDUCATION_LIST_CARDS])))
+_HOMEPAGE_HTML = minify_html(_HOMEPAGE_TEMPLATE.substitute(
+    _COLORS,
+    feature_cards="\n    ".join([
+        _FEATURE_CARD_TEMPLATE.substitute(icon=icon, title=title, description=description,
+                                          accent_color=accent_color)
+        for icon, title, description, accent_color in _FEATURE_CARDS])))
+_ABOUT_HTML = minify_html(_load_asset("about.html").substitute(_COLORS))
+_HELPLINE_HTML = minify_html(_load_asset("helpline.html").substitute(
+    _COLORS,
+    **_ICON_FIELDS,
+    emergency_contacts="".join([_CONTACT_TEMPLATE.substitute(label=label, number=number)
+                                for label, number in _EMERGENCY_CONTACTS])))
+
+
+# Chat requests Gradio may run at once. Every session shares one NarrativeEngine, GameState
+# and TTS handler with no locking, so turns must stay serialized until that state is per-session
+_CHAT_CONCURRENCY_LIMIT = 1
+
+# Streamed story updates: at most one per interval unless this much text is already waiting
+_STREAM_FLUSH_INTERVAL = 0.025  # Seconds
+_STREAM_BUFFER_CHARS = 50
+
+# Consent and audio commands whose replies are never read aloud
+_NO_NARRATION_MESSAGES = frozenset((
+    'i agree', 'i agree with audio', 'i agree without audio',
+    'enable audio', 'disable audio', 'start game',
+))
+
+# Enhanced consent message with better formatting, shown as the chat's first message
+_CONSENT_MESSAGE = """
 🌸 Welcome to SootheAI
 
 *Your supportive companion for understanding anxiety through interactive storytelling*
@@ -82,1274 +226,106 @@ SootheAI is an educational tool designed to help Singapore's youth explore anxie
 🤗 **Ready when you are!** Take your time and begin when you feel comfortable.
 """
 
+
+# Server-sent event routes stream incrementally and must not be buffered by compression
+_STREAMING_PATHS = re.compile(r"/(queue/data|heartbeat/|stream/|call/|upload_progress)")
+
+
+def _fill_on_first_select(tab: "gr.Tab", html: str) -> None:
+    """Leave a tab's page out of the initial config and send it the first time the tab is opened"""
+    import gradio as gr
+
+    page = gr.HTML()
+    loaded = gr.State(False)  # Per session, so later visits don't resend the page
+
+    def fill(already_loaded: bool):
+        return (gr.update() if already_loaded else html), True
+
+    tab.select(fill, inputs=loaded, outputs=[page, loaded],
+               queue=False, show_progress="hidden", show_api=False)
+
+
+def _page_compression_middleware():
+    """Build compression middleware for page, config and asset responses; streaming routes pass straight through"""
+    from starlette.middleware import Middleware
+
+    # Brotli is optional and typically ~20% smaller than gzip; it still sends gzip to clients without br
+    try:
+        from brotli_asgi import BrotliMiddleware as CompressionMiddleware
+        options = {"quality": 4, "minimum_size": 512}
+    except ImportError:
+        from starlette.middleware.gzip import GZipMiddleware as CompressionMiddleware
+        options = {"minimum_size": 512}
+
+    class PageCompressionMiddleware(CompressionMiddleware):
+        async def __call__(self, scope, receive, send) -> None:
+            if scope["type"] == "http" and _STREAMING_PATHS.search(scope["path"]):
+                await self.app(scope, receive, send)
+                return
+            await super().__call__(scope, receive, send)
+
+    return Middleware(PageCompressionMiddleware, **options)
+
+
+def _cards_css_route():
+    """Build the route serving the deferred info-page card stylesheet"""
+    from starlette.responses import Response
+    from starlette.routing import Route
+
+    body = _CARDS_CSS.encode("utf-8")  # Encoded once, not on every request
+
+    async def cards_css(request) -> Response:
+        return Response(body, media_type="text/css",
+                        headers={"Cache-Control": "public, max-age=31536000, immutable"})
+
+    return Route(_CARDS_CSS_PATH, cards_css)
+
+
+class GradioInterface:
+    """Enhanced Gradio interface for SootheAI with professional chatbot design."""
+
+    def __init__(self, elevenlabs_client=None):
+        self.colors = _COLORS
+
+        self.claude_client = get_claude_client()
+        self.narrative_engine = create_narrative_engine()
+        self.tts_handler = get_tts_handler(elevenlabs_client)
+        self.interface = None
+
+        self.consent_message = _CONSENT_MESSAGE
+
         logger.info(
             "SootheAI Gradio interface initialized with professional design")
 
     def create_enhanced_css(self) -> str:
         """Create comprehensive CSS with professional chatbot design"""
-        return f"""
-        /* Import modern fonts */
-        @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&family=Space+Grotesk:wght@400;500;600;700&display=swap');
-        
-        /* Global styles and variables */
-        :root {{
-            --primary-color: {self.colors['primary']};
-            --primary-light: {self.colors['primary_light']};
-            --accent-color: {self.colors['accent']};
-            --accent-light: {self.colors['accent_light']};
-            --text-primary: {self.colors['text_primary']};
-            --text-secondary: {self.colors['text_secondary']};
-            --text-muted: {self.colors['text_muted']};
-            --surface: {self.colors['surface']};
-            --background: {self.colors['background']};
-            --border: {self.colors['border']};
-            --border-focus: {self.colors['border_focus']};
-            --chat-bg: {self.colors['chat_bg']};
-            --user-bubble: {self.colors['user_bubble']};
-            --bot-bubble: {self.colors['bot_bubble']};
-            --border-radius: 12px;
-            --border-radius-lg: 16px;
-            --shadow-sm: 0 1px 2px 0 rgba(0, 0, 0, 0.05);
-            --shadow-md: 0 4px 6px -1px rgba(0, 0, 0, 0.1), 0 2px 4px -1px rgba(0, 0, 0, 0.06);
-            --shadow-lg: 0 10px 15px -3px rgba(0, 0, 0, 0.1), 0 4px 6px -2px rgba(0, 0, 0, 0.05);
-            --shadow-xl: 0 20px 25px -5px rgba(0, 0, 0, 0.1), 0 10px 10px -5px rgba(0, 0, 0, 0.04);
-        }}
-
-        /* Dark Mode Mental Health Calming Background */
-        html, body {{
-            font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
-            background: linear-gradient(135deg, 
-                rgba(15, 23, 42, 0.95) 0%,
-                rgba(30, 41, 59, 0.95) 25%,
-                rgba(51, 65, 85, 0.95) 50%,
-                rgba(30, 41, 59, 0.95) 75%,
-                rgba(15, 23, 42, 0.95) 100%
-            ), 
-            url("data:image/svg+xml,%3Csvg width='60' height='60' viewBox='0 0 60 60' xmlns='http://www.w3.org/2000/svg'%3E%3Cg fill='none' fill-rule='evenodd'%3E%3Cg fill='%23475569' fill-opacity='0.1'%3E%3Ccircle cx='30' cy='30' r='1'/%3E%3C/g%3E%3C/g%3E%3C/svg%3E") !important;
-            background-attachment: fixed !important;
-            background-size: cover, 60px 60px !important;
-            color: #f1f5f9;
-            line-height: 1.6;
-        }}
-
-        /* Dark Mode Main container */
-        .gradio-container {{
-            background: rgba(30, 41, 59, 0.95) !important;
-            backdrop-filter: blur(20px) !important;
-            border-radius: var(--border-radius-lg) !important;
-            box-shadow: 
-                0 20px 40px rgba(0, 0, 0, 0.3),
-                0 8px 16px rgba(0, 0, 0, 0.2),
-                inset 0 1px 0 rgba(255, 255, 255, 0.1) !important;
-            border: 1px solid rgba(71, 85, 105, 0.3) !important;
-            margin: 20px !important;
-            max-width: calc(100vw - 40px) !important;
-        }}
-
-        /* ===== ENHANCED PROFESSIONAL TAB STYLING ===== */
-        .gradio-container .gradio-tabs {{
-            background: transparent !important;
-            margin-bottom: 30px !important;
-        }}
-
-        .gradio-container .gradio-tabs .tab-nav {{
-            background: rgba(51, 65, 85, 0.95) !important;
-            border-radius: 25px !important;
-            padding: 8px !important;
-            display: flex !important;
-            gap: 4px !important;
-            justify-content: center !important;
-            flex-wrap: wrap !important;
-            box-shadow: 
-                0 8px 32px rgba(0, 0, 0, 0.3), 
-                0 4px 16px rgba(0, 0, 0, 0.2),
-                inset 0 1px 0 rgba(255, 255, 255, 0.1) !important;
-            backdrop-filter: blur(20px) !important;
-            border: 1px solid rgba(71, 85, 105, 0.4) !important;
-            position: relative !important;
-            max-width: 900px !important;
-            margin: 0 auto 20px auto !important;
-            overflow: hidden !important;
-        }}
-
-        /* Enhanced tab buttons for dark mode */
-        .gradio-container .gradio-tabs .tab-nav button {{
-            background: transparent !important;
-            color: #94a3b8 !important;
-            border: none !important;
-            border-radius: 20px !important;
-            padding: 14px 20px !important;
-            margin: 0 !important;
-            font-weight: 500 !important;
-            font-size: 14px !important;
-            transition: all 0.4s cubic-bezier(0.25, 0.8, 0.25, 1) !important;
-            min-width: 120px !important;
-            text-align: center !important;
-            position: relative !important;
-            overflow: hidden !important;
-            box-shadow: none !important;
-            z-index: 1 !important;
-            letter-spacing: 0.025em !important;
-            display: flex !important;
-            align-items: center !important;
-            justify-content: center !important;
-            gap: 8px !important;
-            white-space: nowrap !important;
-        }}
-
-        /* Dark mode hover effect */
-        .gradio-container .gradio-tabs .tab-nav button:hover {{
-            background: linear-gradient(135deg, rgba(59, 130, 246, 0.2), rgba(99, 102, 241, 0.25)) !important;
-            color: #60a5fa !important;
-            transform: translateY(-2px) scale(1.03) !important;
-            box-shadow: 
-                0 8px 25px rgba(59, 130, 246, 0.3),
-                0 4px 12px rgba(59, 130, 246, 0.2),
-                inset 0 1px 0 rgba(255, 255, 255, 0.2) !important;
-            border: 1px solid rgba(59, 130, 246, 0.4) !important;
-        }}
-
-        /* Premium selected state */
-        .gradio-container .gradio-tabs .tab-nav button.selected {{
-            background: linear-gradient(135deg, #2563eb 0%, #3b82f6 50%, #6366f1 100%) !important;
-            color: white !important;
-            font-weight: 600 !important;
-            box-shadow: 
-                0 12px 28px rgba(37, 99, 235, 0.35),
-                0 6px 16px rgba(37, 99, 235, 0.25),
-                inset 0 1px 0 rgba(255, 255, 255, 0.3),
-                inset 0 -1px 0 rgba(0, 0, 0, 0.1) !important;
-            transform: translateY(-3px) !important;
-            border: 1px solid rgba(37, 99, 235, 0.5) !important;
-            text-shadow: 0 1px 2px rgba(0, 0, 0, 0.2) !important;
-            z-index: 2 !important;
-        }}
-
-        /* Glossy effect for selected tab */
-        .gradio-container .gradio-tabs .tab-nav button.selected::before {{
-            content: '';
-            position: absolute;
-            top: 1px;
-            left: 1px;
-            right: 1px;
-            height: 50%;
-            background: linear-gradient(180deg, rgba(255, 255, 255, 0.3), rgba(255, 255, 255, 0.1));
-            border-radius: 19px 19px 10px 10px;
-            z-index: -1;
-            transition: all 0.4s ease;
-        }}
-
-        /* Subtle glow animation for selected tab */
-        .gradio-container .gradio-tabs .tab-nav button.selected::after {{
-            content: '';
-            position: absolute;
-            top: -2px;
-            left: -2px;
-            right: -2px;
-            bottom: -2px;
-            background: linear-gradient(135deg, rgba(59, 130, 246, 0.2), rgba(99, 102, 241, 0.2));
-            border-radius: 22px;
-            z-index: -2;
-            opacity: 0;
-            animation: selectedGlow 3s ease-in-out infinite;
-        }}
-
-        /* Active/click state for tactile feedback */
-        .gradio-container .gradio-tabs .tab-nav button:active {{
-            transform: translateY(-1px) scale(0.98) !important;
-            transition: all 0.1s ease !important;
-        }}
-
-        /* Focus state for accessibility */
-        .gradio-container .gradio-tabs .tab-nav button:focus {{
-            outline: 2px solid rgba(59, 130, 246, 0.6) !important;
-            outline-offset: 3px !important;
-        }}
-
-        /* Loading animation for tabs */
-        .gradio-container .gradio-tabs .tab-nav button {{
-            animation: tabSlideIn 0.6s ease-out backwards !important;
-        }}
-
-        .gradio-container .gradio-tabs .tab-nav button:nth-child(1) {{ animation-delay: 0.1s !important; }}
-        .gradio-container .gradio-tabs .tab-nav button:nth-child(2) {{ animation-delay: 0.2s !important; }}
-        .gradio-container .gradio-tabs .tab-nav button:nth-child(3) {{ animation-delay: 0.3s !important; }}
-        .gradio-container .gradio-tabs .tab-nav button:nth-child(4) {{ animation-delay: 0.4s !important; }}
-        .gradio-container .gradio-tabs .tab-nav button:nth-child(5) {{ animation-delay: 0.5s !important; }}
-
-        /* Tab content area styling */
-        .gradio-container .gradio-tabs .tabitem {{
-            padding: 20px 0 !important;
-            animation: contentFadeIn 0.5s ease-out !important;
-        }}
-
-        /* ===== PROFESSIONAL CHATBOT STYLING ===== */
-        
-        /* Chat container */
-        .chat-tab .gradio-container {{
-            max-width: 1200px !important;
-            margin: 0 auto !important;
-            padding: 0 !important;
-        }}
-
-        /* Enhanced chatbot container */
-        .gradio-container .chatbot {{
-            background: linear-gradient(145deg, #2a3441 0%, #232b36 100%) !important;
-            border: 1px solid #3f4b5a !important;
-            border-radius: 16px !important;
-            box-shadow: 
-                0 20px 40px rgba(0, 0, 0, 0.15),
-                0 8px 16px rgba(0, 0, 0, 0.1),
-                inset 0 1px 0 rgba(255, 255, 255, 0.05) !important;
-            padding: 0 !important;
-            margin: 20px !important;
-            overflow: hidden !important;
-            position: relative !important;
-        }}
-
-        /* Messages container with better padding */
-        .gradio-container .chatbot .message-container,
-        .gradio-container .chatbot > div {{
-            padding: 24px !important;
-            max-height: 65vh !important;
-            overflow-y: auto !important;
-            scroll-behavior: smooth !important;
-            background: transparent !important;
-        }}
-
-        /* Enhanced individual message styling */
-        .gradio-container .chatbot .message {{
-            margin: 24px 0 !important;
-            padding: 0 !important;
-            background: transparent !important;
-            border: none !important;
-            box-shadow: none !important;
-            display: flex !important;
-            align-items: flex-start !important;
-            gap: 16px !important;
-            font-size: 15px !important;
-            line-height: 1.6 !important;
-            animation: messageSlideIn 0.4s ease-out !important;
-        }}
-
-        /* Bot messages (left-aligned) - Enhanced */
-        .gradio-container .chatbot .message:nth-child(even) {{
-            margin-right: 60px !important;
-            margin-left: 0 !important;
-        }}
-
-        .gradio-container .chatbot .message:nth-child(even) > div:last-child {{
-            background: linear-gradient(145deg, #374151, #4b5563) !important;
-            color: #f1f5f9 !important;
-            padding: 18px 22px !important;
-            border-radius: 18px 18px 18px 6px !important;
-            box-shadow: 
-                0 4px 12px rgba(0, 0, 0, 0.2),
-                0 2px 6px rgba(0, 0, 0, 0.1),
-                inset 0 1px 0 rgba(255, 255, 255, 0.1) !important;
-            border: 1px solid #475569 !important;
-            margin: 0 !important;
-            max-width: 100% !important;
-            word-wrap: break-word !important;
-            position: relative !important;
-        }}
-
-        /* User messages (right-aligned) - Enhanced */
-        .gradio-container .chatbot .message:nth-child(odd) {{
-            flex-direction: row-reverse !important;
-            margin-left: 60px !important;
-            margin-right: 0 !important;
-        }}
-
-        .gradio-container .chatbot .message:nth-child(odd) > div:last-child {{
-            background: linear-gradient(135deg, #2563eb, #3b82f6) !important;
-            color: white !important;
-            padding: 18px 22px !important;
-            border-radius: 18px 18px 6px 18px !important;
-            box-shadow: 
-                0 4px 12px rgba(37, 99, 235, 0.3),
-                0 2px 6px rgba(37, 99, 235, 0.2),
-                inset 0 1px 0 rgba(255, 255, 255, 0.2) !important;
-            border: none !important;
-            margin: 0 !important;
-            max-width: 100% !important;
-            word-wrap: break-word !important;
-        }}
-
-        /* Enhanced message avatars */
-        .gradio-container .chatbot .message::before {{
-            content: "";
-            width: 42px;
-            height: 42px;
-            border-radius: 50%;
-            flex-shrink: 0;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            font-size: 18px;
-            font-weight: 600;
-            box-shadow: 
-                0 4px 12px rgba(0, 0, 0, 0.15),
-                0 2px 6px rgba(0, 0, 0, 0.1);
-            border: 2px solid rgba(255, 255, 255, 0.1);
-        }}
-
-        .gradio-container .chatbot .message:nth-child(even)::before {{
-            content: "🤖";
-            background: linear-gradient(135deg, #6366f1, #8b5cf6);
-            color: white;
-            order: 0;
-        }}
-
-        .gradio-container .chatbot .message:nth-child(odd)::before {{
-            content: "👤";
-            background: linear-gradient(135deg, #10b981, #34d399);
-            color: white;
-            order: 2;
-        }}
-
-        /* Professional input area - Dark Mode */
-        .gradio-container .chat-interface-input {{
-            background: rgba(51, 65, 85, 0.9) !important;
-            border: 2px solid #475569 !important;
-            border-radius: 24px !important;
-            padding: 16px 60px 16px 24px !important;
-            margin: 20px !important;
-            box-shadow: 
-                0 8px 24px rgba(0, 0, 0, 0.2),
-                0 4px 12px rgba(0, 0, 0, 0.1),
-                inset 0 1px 0 rgba(255, 255, 255, 0.1) !important;
-            transition: all 0.3s ease !important;
-            position: relative !important;
-            backdrop-filter: blur(10px) !important;
-        }}
-
-        .gradio-container .chat-interface-input:focus-within {{
-            border-color: #60a5fa !important;
-            box-shadow: 
-                0 0 0 3px rgba(96, 165, 250, 0.2),
-                0 8px 24px rgba(0, 0, 0, 0.3) !important;
-            transform: translateY(-2px) !important;
-        }}
-
-        /* Input textbox styling - Dark Mode */
-        .gradio-container input[type="text"].soothe-textbox,
-        .gradio-container textarea.soothe-textbox {{
-            background: transparent !important;
-            border: none !important;
-            border-radius: 0 !important;
-            padding: 4px 0 !important;
-            font-size: 16px !important;
-            line-height: 1.5 !important;
-            resize: none !important;
-            box-shadow: none !important;
-            outline: none !important;
-            color: #f1f5f9 !important;
-        }}
-
-        .gradio-container input[type="text"].soothe-textbox::placeholder,
-        .gradio-container textarea.soothe-textbox::placeholder {{
-            color: #94a3b8 !important;
-            opacity: 0.8 !important;
-        }}
-
-        /* Enhanced send button */
-        .gradio-container .chat-interface-input button {{
-            background: linear-gradient(135deg, #2563eb, #3b82f6) !important;
-            color: white !important;
-            border: none !important;
-            border-radius: 20px !important;
-            padding: 12px 16px !important;
-            font-weight: 600 !important;
-            font-size: 14px !important;
-            cursor: pointer !important;
-            transition: all 0.3s ease !important;
-            box-shadow: 
-                0 4px 12px rgba(37, 99, 235, 0.3),
-                0 2px 6px rgba(37, 99, 235, 0.2) !important;
-            position: absolute !important;
-            right: 8px !important;
-            top: 50% !important;
-            transform: translateY(-50%) !important;
-            width: 44px !important;
-            height: 44px !important;
-            display: flex !important;
-            align-items: center !important;
-            justify-content: center !important;
-        }}
-
-        .gradio-container .chat-interface-input button:hover {{
-            background: linear-gradient(135deg, #1d4ed8, #2563eb) !important;
-            transform: translateY(-50%) scale(1.05) !important;
-            box-shadow: 
-                0 6px 16px rgba(37, 99, 235, 0.4),
-                0 4px 8px rgba(37, 99, 235, 0.3) !important;
-        }}
-
-        .gradio-container .chat-interface-input button:active {{
-            transform: translateY(-50%) scale(0.95) !important;
-        }}
-
-        /* Enhanced examples section */
-        .gradio-container .examples {{
-            background: linear-gradient(145deg, #374151, #4b5563) !important;
-            border: 1px solid #6b7280 !important;
-            border-radius: 16px !important;
-            padding: 24px !important;
-            margin: 20px !important;
-            box-shadow: 
-                0 8px 24px rgba(0, 0, 0, 0.1),
-                inset 0 1px 0 rgba(255, 255, 255, 0.1) !important;
-        }}
-
-        .gradio-container .examples h4 {{
-            color: #f9fafb !important;
-            font-weight: 600 !important;
-            margin-bottom: 16px !important;
-            font-size: 16px !important;
-        }}
-
-        .gradio-container .examples button {{
-            background: linear-gradient(135deg, #6b7280, #9ca3af) !important;
-            color: #f9fafb !important;
-            border: 1px solid #9ca3af !important;
-            border-radius: 20px !important;
-            padding: 10px 18px !important;
-            margin: 6px 8px 6px 0 !important;
-            font-weight: 500 !important;
-            font-size: 14px !important;
-            transition: all 0.3s ease !important;
-            box-shadow: 0 2px 8px rgba(0, 0, 0, 0.1) !important;
-        }}
-
-        .gradio-container .examples button:hover {{
-            background: linear-gradient(135deg, #2563eb, #3b82f6) !important;
-            color: white !important;
-            border-color: #3b82f6 !important;
-            transform: translateY(-2px) !important;
-            box-shadow: 0 4px 12px rgba(37, 99, 235, 0.3) !important;
-        }}
-
-        /* Professional scrollbar */
-        .gradio-container .chatbot ::-webkit-scrollbar {{
-            width: 8px !important;
-        }}
-
-        .gradio-container .chatbot ::-webkit-scrollbar-track {{
-            background: rgba(255, 255, 255, 0.1) !important;
-            border-radius: 4px !important;
-        }}
-
-        .gradio-container .chatbot ::-webkit-scrollbar-thumb {{
-            background: linear-gradient(180deg, #64748b, #475569) !important;
-            border-radius: 4px !important;
-            border: 1px solid rgba(255, 255, 255, 0.1) !important;
-        }}
-
-        .gradio-container .chatbot ::-webkit-scrollbar-thumb:hover {{
-            background: linear-gradient(180deg, #475569, #334155) !important;
-        }}
-
-        /* Enhanced content formatting */
-        .gradio-container .chatbot .message h1,
-        .gradio-container .chatbot .message h2,
-        .gradio-container .chatbot .message h3 {{
-            color: inherit !important;
-            margin: 16px 0 12px 0 !important;
-            line-height: 1.3 !important;
-            font-weight: 600 !important;
-        }}
-
-        .gradio-container .chatbot .message p {{
-            margin: 12px 0 !important;
-            line-height: 1.6 !important;
-        }}
-
-        .gradio-container .chatbot .message ul,
-        .gradio-container .chatbot .message ol {{
-            margin: 12px 0 !important;
-            padding-left: 24px !important;
-        }}
-
-        .gradio-container .chatbot .message li {{
-            margin: 6px 0 !important;
-            line-height: 1.5 !important;
-        }}
-
-        .gradio-container .chatbot .message code {{
-            background: rgba(0, 0, 0, 0.2) !important;
-            padding: 3px 8px !important;
-            border-radius: 6px !important;
-            font-family: 'JetBrains Mono', 'Consolas', monospace !important;
-            font-size: 14px !important;
-        }}
-
-        .gradio-container .chatbot .message pre {{
-            background: rgba(0, 0, 0, 0.3) !important;
-            padding: 16px !important;
-            border-radius: 10px !important;
-            overflow-x: auto !important;
-            margin: 16px 0 !important;
-            border: 1px solid rgba(255, 255, 255, 0.1) !important;
-        }}
-
-        /* ===== ENHANCED CONTENT SECTIONS - DARK MODE ===== */
-        .soothe-content-section {{
-            background: linear-gradient(145deg, rgba(51, 65, 85, 0.9), rgba(30, 41, 59, 0.9)) !important;
-            border: 1px solid rgba(71, 85, 105, 0.5) !important;
-            border-radius: var(--border-radius-lg) !important;
-            padding: 32px !important;
-            margin: 24px 0 !important;
-            box-shadow: 
-                0 8px 24px rgba(0, 0, 0, 0.2),
-                0 4px 12px rgba(0, 0, 0, 0.1),
-                inset 0 1px 0 rgba(255, 255, 255, 0.1) !important;
-            transition: all 0.3s ease !important;
-        }}
-
-        .soothe-content-section:hover {{
-            box-shadow: 
-                0 12px 32px rgba(0, 0, 0, 0.3),
-                0 6px 16px rgba(0, 0, 0, 0.2),
-                inset 0 1px 0 rgba(255, 255, 255, 0.15) !important;
-            transform: translateY(-2px) !important;
-        }}
-
-        .soothe-content-section h2 {{
-            color: #60a5fa !important;
-            font-family: 'Space Grotesk', sans-serif !important;
-            font-weight: 600 !important;
-            font-size: 28px !important;
-            margin-bottom: 16px !important;
-            display: flex !important;
-            align-items: center !important;
-            gap: 12px !important;
-        }}
-
-        /* Feature cards - Dark Mode */
-        .soothe-feature-card {{
-            background: linear-gradient(145deg, rgba(51, 65, 85, 0.9), rgba(30, 41, 59, 0.9)) !important;
-            border: 1px solid rgba(71, 85, 105, 0.5) !important;
-            border-radius: var(--border-radius-lg) !important;
-            padding: 24px !important;
-            text-align: center !important;
-            transition: all 0.3s ease !important;
-            box-shadow: 
-                0 8px 24px rgba(0, 0, 0, 0.2),
-                0 4px 12px rgba(0, 0, 0, 0.1) !important;
-            min-height: 200px !important;
-            display: flex !important;
-            flex-direction: column !important;
-            justify-content: center !important;
-        }}
-
-        .soothe-feature-card:hover {{
-            transform: translateY(-4px) scale(1.02) !important;
-            box-shadow: 
-                0 16px 40px rgba(0, 0, 0, 0.3),
-                0 8px 20px rgba(0, 0, 0, 0.2) !important;
-            border-color: var(--accent-color) !important;
-        }}
-
-        /* ===== TYPOGRAPHY & GENERAL STYLES - DARK MODE ===== */
-        h1, h2, h3, h4, h5, h6 {{
-            font-family: 'Space Grotesk', sans-serif !important;
-            color: #f1f5f9 !important;
-            line-height: 1.3 !important;
-        }}
-
-        a {{
-            color: #60a5fa !important;
-            text-decoration: none !important;
-            font-weight: 500 !important;
-            transition: color 0.2s ease !important;
-        }}
-
-        a:hover {{
-            color: #93c5fd !important;
-            text-decoration: underline !important;
-        }}
-
-        /* Focus indicators for accessibility - Dark Mode */
-        .gradio-container button:focus,
-        .gradio-container input:focus,
-        .gradio-container textarea:focus {{
-            outline: 2px solid #60a5fa !important;
-            outline-offset: 2px !important;
-        }}
-
-        /* ===== MOBILE RESPONSIVENESS ===== */
-        @media (max-width: 768px) {{
-            .gradio-container .gradio-tabs .tab-nav {{
-                padding: 6px !important;
-                margin: 0 10px 20px 10px !important;
-                max-width: calc(100vw - 20px) !important;
-            }}
-            
-            .gradio-container .gradio-tabs .tab-nav button {{
-                min-width: 100px !important;
-                padding: 12px 16px !important;
-                font-size: 13px !important;
-                flex: 1 !important;
-            }}
-
-            .gradio-container .chatbot {{
-                margin: 10px !important;
-                border-radius: 12px !important;
-            }}
-            
-            .gradio-container .chatbot .message:nth-child(odd) {{
-                margin-left: 40px !important;
-            }}
-            
-            .gradio-container .chatbot .message:nth-child(even) {{
-                margin-right: 40px !important;
-            }}
-
-            .gradio-container .chat-interface-input {{
-                margin: 10px !important;
-                padding: 12px 50px 12px 16px !important;
-            }}
-            
-            .gradio-container .examples {{
-                margin: 10px !important;
-                padding: 16px !important;
-            }}
-        }}
-
-        @media (max-width: 480px) {{
-            .gradio-container .gradio-tabs .tab-nav {{
-                flex-direction: column !important;
-                gap: 2px !important;
-                padding: 4px !important;
-            }}
-            
-            .gradio-container .gradio-tabs .tab-nav button {{
-                min-width: auto !important;
-                width: 100% !important;
-                margin: 0 !important;
-            }}
-        }}
-
-        /* ===== ANIMATION KEYFRAMES ===== */
-        @keyframes selectedGlow {{
-            0%, 100% {{ 
-                opacity: 0.3; 
-                transform: scale(1); 
-            }}
-            50% {{ 
-                opacity: 0.6; 
-                transform: scale(1.05); 
-            }}
-        }}
-
-        @keyframes tabSlideIn {{
-            from {{ 
-                opacity: 0; 
-                transform: translateY(15px) scale(0.9); 
-            }}
-            to {{ 
-                opacity: 1; 
-                transform: translateY(0) scale(1); 
-            }}
-        }}
-
-        @keyframes contentFadeIn {{
-            from {{ 
-                opacity: 0; 
-                transform: translateY(10px); 
-            }}
-            to {{ 
-                opacity: 1; 
-                transform: translateY(0); 
-            }}
-        }}
-
-        @keyframes messageSlideIn {{
-            from {{ 
-                opacity: 0; 
-                transform: translateY(10px); 
-            }}
-            to {{ 
-                opacity: 1; 
-                transform: translateY(0); 
-            }}
-        }}
-
-        /* Loading indicator for better UX */
-        .gradio-container .chatbot .loading {{
-            display: flex !important;
-            align-items: center !important;
-            gap: 8px !important;
-            color: #9ca3af !important;
-            font-style: italic !important;
-            margin: 16px 0 !important;
-        }}
-
-        .gradio-container .chatbot .loading::after {{
-            content: "●●●";
-            animation: loadingDots 1.5s infinite;
-        }}
-
-        @keyframes loadingDots {{
-            0%, 20% {{ opacity: 0; }}
-            50% {{ opacity: 1; }}
-            80%, 100% {{ opacity: 0; }}
-        }}
-        """
+        return _ENHANCED_CSS
 
     def create_enhanced_homepage(self) -> str:
-        """Create an enhanced homepage with modern design"""
-        return f'''
-        <div style="
-            background: linear-gradient(135deg, {self.colors['gradient_start']}, {self.colors['gradient_end']}) !important;
-            color: white !important;
-            padding: 60px 20px !important;
-            text-align: center !important;
-            border-radius: 20px !important;
-            margin-bottom: 30px !important;
-            box-shadow: var(--shadow-xl) !important;
-            border: none !important;
-            outline: none !important;
-        ">
-            <div style="
-                display: inline-flex !important;
-                align-items: center !important;
-                background: rgba(255, 182, 193, 0.2) !important;
-                border-radius: 50px !important;
-                padding: 8px 20px !important;
-                margin-bottom: 30px !important;
-                backdrop-filter: blur(10px) !important;
-                border: 1px solid rgba(255, 182, 193, 0.3) !important;
-            ">
-                <span style="font-size: 24px !important; margin-right: 10px !important;">🌱</span>
-                <span style="font-weight: 600 !important; font-size: 14px !important; letter-spacing: 1px !important; color: white !important;">AI-POWERED MENTAL HEALTH SUPPORT</span>
-            </div>
-
-            <h1 style="
-                font-family: 'Space Grotesk', sans-serif !important;
-                font-size: clamp(2.5rem, 5vw, 4rem) !important;
-                font-weight: 700 !important;
-                margin-bottom: 20px !important;
-                background: linear-gradient(45deg, #ffffff, #f0f9ff) !important;
-                -webkit-background-clip: text !important;
-                background-clip: text !important;
-                -webkit-text-fill-color: transparent !important;
-                line-height: 1.1 !important;
-            ">
-                Welcome to<br>
-                <span style="background: linear-gradient(45deg, #10b981, #34d399, #6ee7b7, #10b981); background-size: 300% 300%; -webkit-background-clip: text; background-clip: text; -webkit-text-fill-color: transparent; animation: gradientShift 3s ease-in-out infinite;">SootheAI</span>
-            </h1>
-
-            <p style="
-                font-size: 1.3rem !important;
-                margin-bottom: 40px !important;
-                opacity: 0.9 !important;
-                max-width: 600px !important;
-                margin-left: auto !important;
-                margin-right: auto !important;
-                line-height: 1.6 !important;
-                color: white !important;
-            ">
-                Navigate anxiety through interactive storytelling designed specifically for Singapore's youth
-            </p>
-
-            <div style="
-                display: flex !important;
-                gap: 20px !important;
-                justify-content: center !important;
-                flex-wrap: wrap !important;
-                margin-bottom: 40px !important;
-            ">
-                <div style="
-                    background: rgba(255, 255, 255, 0.1) !important;
-                    padding: 8px 16px !important;
-                    border-radius: 25px !important;
-                    border: 1px solid rgba(255, 255, 255, 0.2) !important;
-                    backdrop-filter: blur(10px) !important;
-                    font-size: 14px !important;
-                    font-weight: 500 !important;
-                    color: white !important;
-                ">
-                    ✨ Safe & Private
-                </div>
-                <div style="
-                    background: rgba(255, 255, 255, 0.1) !important;
-                    padding: 8px 16px !important;
-                    border-radius: 25px !important;
-                    border: 1px solid rgba(255, 255, 255, 0.2) !important;
-                    backdrop-filter: blur(10px) !important;
-                    font-size: 14px !important;
-                    font-weight: 500 !important;
-                    color: white !important;
-                ">
-                    🎓 Educational Focus
-                </div>
-                <div style="
-                    background: rgba(255, 255, 255, 0.1) !important;
-                    padding: 8px 16px !important;
-                    border-radius: 25px !important;
-                    border: 1px solid rgba(255, 255, 255, 0.2) !important;
-                    backdrop-filter: blur(10px) !important;
-                    font-size: 14px !important;
-                    font-weight: 500 !important;
-                    color: white !important;
-                ">
-                    🇸🇬 Singapore Context
-                </div>
-            </div>
-
-            <button onclick="
-                Array.from(document.querySelectorAll('button, .tabitem, .tab-nav button')).forEach(btn => {{
-                    if (btn.innerText.trim().includes('SootheAI Chat')) btn.click();
-                }});
-            " style="
-                background: linear-gradient(135deg, {self.colors['accent']}, {self.colors['accent_light']});
-                color: white;
-                border: none;
-                padding: 16px 32px;
-                border-radius: 50px;
-                font-size: 18px;
-                font-weight: 600;
-                cursor: pointer;
-                transition: all 0.3s ease;
-                box-shadow: 0 8px 25px rgba(16, 185, 129, 0.3);
-                border: 2px solid rgba(255, 255, 255, 0.2);
-            " onmouseover="
-                this.style.transform = 'translateY(-3px) scale(1.05)';
-                this.style.boxShadow = '0 15px 35px rgba(16, 185, 129, 0.4)';
-            " onmouseout="
-                this.style.transform = 'translateY(0) scale(1)';
-                this.style.boxShadow = '0 8px 25px rgba(16, 185, 129, 0.3)';
-            ">
-                🚀 Start Your Journey
-            </button>
-            
-            <style>
-                @keyframes gradientShift {{
-                    0%, 100% {{ background-position: 0% 50%; }}
-                    50% {{ background-position: 100% 50%; }}
-                }}
-            </style>
-        </div>
-
-        <div style="
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(280px, 1fr));
-            gap: 30px;
-            margin: 40px 0;
-        ">
-            {self._create_feature_card("📖", "Interactive Stories", "Experience relatable scenarios through AI-powered storytelling", "#3b82f6")}
-            {self._create_feature_card("🎯", "Personalized Learning", "AI adapts to your choices for a unique learning experience", "#10b981")}
-            {self._create_feature_card("🤝", "Safe Environment", "Learn anxiety management in a supportive, judgment-free space", "#f59e0b")}
-            {self._create_feature_card("🇸🇬", "Local Context", "Stories set in familiar Singaporean school environments", "#ef4444")}
-        </div>
-        '''
-
-    def _create_feature_card(self, icon: str, title: str, description: str, accent_color: str) -> str:
-        """Create an enhanced feature card with icon-based background colors"""
-        return f'''
-        <div style="
-            background: linear-gradient(145deg, {accent_color}, {accent_color}dd) !important;
-            border: 1px solid {accent_color} !important;
-            border-radius: 20px !important;
-            padding: 30px 20px !important;
-            text-align: center !important;
-            transition: all 0.3s ease !important;
-            box-shadow: 0 4px 20px {accent_color}33 !important;
-            position: relative !important;
-            overflow: hidden !important;
-            color: white !important;
-            min-height: 200px !important;
-            display: flex !important;
-            flex-direction: column !important;
-            justify-content: center !important;
-        " onmouseover="
-            this.style.transform = 'translateY(-8px) scale(1.02)';
-            this.style.boxShadow = '0 20px 40px {accent_color}55';
-            this.style.background = 'linear-gradient(145deg, {accent_color}ee, {accent_color}) !important';
-        " onmouseout="
-            this.style.transform = 'translateY(0) scale(1)';
-            this.style.boxShadow = '0 4px 20px {accent_color}33';
-            this.style.background = 'linear-gradient(145deg, {accent_color}, {accent_color}dd) !important';
-        ">
-            <div style="
-                position: absolute !important;
-                top: 0 !important;
-                left: 0 !important;
-                right: 0 !important;
-                height: 4px !important;
-                background: linear-gradient(90deg, rgba(255,255,255,0.5), rgba(255,255,255,0.2)) !important;
-            "></div>
-            
-            <div style="
-                font-size: 3.5rem !important;
-                margin-bottom: 20px !important;
-                background: rgba(255, 255, 255, 0.2) !important;
-                width: 80px !important;
-                height: 80px !important;
-                border-radius: 20px !important;
-                display: flex !important;
-                align-items: center !important;
-                justify-content: center !important;
-                margin: 0 auto 20px auto !important;
-                box-shadow: 0 8px 25px rgba(0,0,0,0.2) !important;
-                backdrop-filter: blur(10px) !important;
-            ">
-                <span style="filter: none !important;">{icon}</span>
-            </div>
-            
-            <h3 style="
-                color: white !important;
-                font-family: 'Space Grotesk', sans-serif !important;
-                font-size: 1.4rem !important;
-                font-weight: 700 !important;
-                margin-bottom: 12px !important;
-                line-height: 1.3 !important;
-                text-shadow: 0 2px 4px rgba(0,0,0,0.3) !important;
-            ">{title}</h3>
-            
-            <p style="
-                color: rgba(255, 255, 255, 0.9) !important;
-                line-height: 1.6 !important;
-                margin: 0 !important;
-                font-size: 1rem !important;
-                font-weight: 500 !important;
-                text-shadow: 0 1px 2px rgba(0,0,0,0.2) !important;
-            ">{description}</p>
-        </div>
-        '''
+        """Return the enhanced homepage HTML, rendered once at import"""
+        return _HOMEPAGE_HTML
 
     def create_anxiety_education_content(self) -> str:
-        """Create enhanced anxiety education content with readable dark mode colors"""
-        return f'''
-        <div class="soothe-content-section">
-            <h2>
-                <span style="
-                    background: linear-gradient(135deg, {self.colors['accent']}, {self.colors['accent_light']});
-                    color: white;
-                    padding: 8px 12px;
-                    border-radius: 10px;
-                    margin-right: 10px;
-                ">📚</span>
-                Understanding Anxiety
-            </h2>
-            
-            <div style="
-                background: linear-gradient(135deg, rgba(51, 65, 85, 0.8), rgba(30, 41, 59, 0.8));
-                padding: 24px;
-                border-radius: 16px;
-                border-left: 5px solid {self.colors['accent']};
-                margin: 20px 0;
-            ">
-                <h3 style="color: #93c5fd !important;">What is Anxiety?</h3>
-                <p style="color: #e2e8f0 !important; font-weight: 500 !important;">Anxiety is a natural response to stress that everyone experiences. However, when anxiety becomes overwhelming or persistent, it can impact daily life and wellbeing. In Singapore's competitive academic environment, many students face anxiety related to performance pressure.</p>
-            </div>
-
-            <div style="
-                display: grid;
-                grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
-                gap: 24px;
-                margin: 30px 0;
-            ">
-                <div style="
-                    background: linear-gradient(135deg, rgba(120, 53, 15, 0.3), rgba(92, 38, 11, 0.3));
-                    padding: 24px;
-                    border-radius: 16px;
-                    border-left: 5px solid {self.colors['warning']};
-                    border: 1px solid rgba(251, 191, 36, 0.3);
-                ">
-                    <h3 style="color: #fbbf24 !important;">⚠️ Common Signs</h3>
-                    <ul style="color: #fde68a !important; line-height: 1.8;">
-                        <li style="color: #fde68a !important; font-weight: 500 !important;"><strong style="color: #fbbf24 !important;">Physical:</strong> Racing heart, sweating, difficulty breathing</li>
-                        <li style="color: #fde68a !important; font-weight: 500 !important;"><strong style="color: #fbbf24 !important;">Emotional:</strong> Persistent worry, irritability, restlessness</li>
-                        <li style="color: #fde68a !important; font-weight: 500 !important;"><strong style="color: #fbbf24 !important;">Behavioral:</strong> Avoidance, procrastination, perfectionism</li>
-                        <li style="color: #fde68a !important; font-weight: 500 !important;"><strong style="color: #fbbf24 !important;">Cognitive:</strong> Racing thoughts, difficulty concentrating</li>
-                    </ul>
-                </div>
-
-                <div style="
-                    background: linear-gradient(135deg, rgba(5, 150, 105, 0.3), rgba(4, 120, 87, 0.3));
-                    padding: 24px;
-                    border-radius: 16px;
-                    border-left: 5px solid {self.colors['success']};
-                    border: 1px solid rgba(52, 211, 153, 0.3);
-                ">
-                    <h3 style="color: #34d399 !important;">💡 Healthy Coping</h3>
-                    <ul style="color: #a7f3d0 !important; line-height: 1.8;">
-                        <li style="color: #a7f3d0 !important; font-weight: 500 !important;"><strong style="color: #34d399 !important;">Breathing:</strong> Deep, slow breathing exercises</li>
-                        <li style="color: #a7f3d0 !important; font-weight: 500 !important;"><strong style="color: #34d399 !important;">Mindfulness:</strong> Present-moment awareness practices</li>
-                        <li style="color: #a7f3d0 !important; font-weight: 500 !important;"><strong style="color: #34d399 !important;">Exercise:</strong> Regular physical activity</li>
-                        <li style="color: #a7f3d0 !important; font-weight: 500 !important;"><strong style="color: #34d399 !important;">Support:</strong> Talking to trusted friends or professionals</li>
-                    </ul>
-                </div>
-            </div>
-
-            <div style="
-                background: linear-gradient(135deg, rgba(37, 99, 235, 0.2), rgba(16, 185, 129, 0.2));
-                padding: 24px;
-                border-radius: 16px;
-                border: 2px solid rgba(37, 99, 235, 0.3);
-                text-align: center;
-                margin-top: 30px;
-            ">
-                <h3 style="color: #60a5fa !important;">🎯 Ready to Practice?</h3>
-                <p style="color: #cbd5e1; font-weight: 500 !important;">Experience these concepts through interactive stories where you can explore different coping strategies in realistic scenarios.</p>
-                <button onclick="
-                    Array.from(document.querySelectorAll('button, .tabitem, .tab-nav button')).forEach(btn => {{
-                        if (btn.innerText.trim().includes('SootheAI Chat')) btn.click();
-                    }});
-                " style="
-                    background: linear-gradient(135deg, {self.colors['primary']}, {self.colors['primary_light']});
-                    color: white;
-                    border: none;
-                    padding: 12px 24px;
-                    border-radius: 25px;
-                    font-weight: 600;
-                    cursor: pointer;
-                    transition: all 0.3s ease;
-                    margin-top: 15px;
-                " onmouseover="this.style.transform = 'scale(1.05)'" onmouseout="this.style.transform = 'scale(1)'">
-                    Start Interactive Learning →
-                </button>
-            </div>
-        </div>
-        '''
+        """Return the anxiety education content, rendered once at import"""
+        return _ANXIETY_EDUCATION_HTML
 
     def create_helpline_content(self) -> str:
-        """Create enhanced helpline content with readable dark mode colors"""
-        return f'''
-        <div class="soothe-content-section">
-            <h2>
-                <span style="
-                    background: linear-gradient(135deg, {self.colors['error']}, #ef4444);
-                    color: white;
-                    padding: 8px 12px;
-                    border-radius: 10px;
-                    margin-right: 10px;
-                ">🆘</span>
-                Mental Health Support
-            </h2>
-
-            <div style="
-                background: linear-gradient(135deg, rgba(239, 68, 68, 0.2), rgba(220, 38, 38, 0.2));
-                padding: 24px;
-                border-radius: 16px;
-                border: 2px solid rgba(248, 113, 113, 0.4);
-                margin: 20px 0;
-                text-align: center;
-            ">
-                <h3 style="color: #fca5a5; margin-bottom: 15px;">🚨 Emergency Contacts</h3>
-                <p style="color: #fed7d7; font-weight: 500; margin-bottom: 20px;">
-                    If you or someone you know is experiencing a mental health emergency, please contact these 24/7 helplines:
-                </p>
-                
-                <div style="
-                    display: grid;
-                    grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
-                    gap: 16px;
-                    margin-top: 20px;
-                ">
-                    <div style="
-                        background: rgba(30, 41, 59, 0.9);
-                        padding: 16px;
-                        border-radius: 12px;
-                        box-shadow: 0 4px 12px rgba(239, 68, 68, 0.2);
-                        border-left: 4px solid {self.colors['error']};
-                    ">
-                        <strong style="color: #fca5a5;">Emergency</strong><br>
-                        <span style="font-size: 1.5rem; font-weight: 700; color: #ef4444;">999</span>
-                    </div>
-                    <div style="
-                        background: rgba(30, 41, 59, 0.9);
-                        padding: 16px;
-                        border-radius: 12px;
-                        box-shadow: 0 4px 12px rgba(239, 68, 68, 0.2);
-                        border-left: 4px solid {self.colors['error']};
-                    ">
-                        <strong style="color: #fca5a5;">SOS Helpline</strong><br>
-                        <span style="font-size: 1.5rem; font-weight: 700; color: #ef4444;">1-767</span>
-                    </div>
-                    <div style="
-                        background: rgba(30, 41, 59, 0.9);
-                        padding: 16px;
-                        border-radius: 12px;
-                        box-shadow: 0 4px 12px rgba(239, 68, 68, 0.2);
-                        border-left: 4px solid {self.colors['error']};
-                    ">
-                        <strong style="color: #fca5a5;">National Care</strong><br>
-                        <span style="font-size: 1.2rem; font-weight: 700; color: #ef4444;">1800-202-6868</span>
-                    </div>
-                </div>
-            </div>
-
-            <div style="
-                background: linear-gradient(135deg, rgba(37, 99, 235, 0.2), rgba(29, 78, 216, 0.2));
-                padding: 24px;
-                border-radius: 16px;
-                border-left: 5px solid {self.colors['primary']};
-                border: 1px solid rgba(96, 165, 250, 0.3);
-                margin: 20px 0;
-            ">
-                <h3 style="color: #60a5fa;">🧑‍🎓 Youth-Specific Support</h3>
-                
-                <div style="display: grid; gap: 16px; margin-top: 16px;">
-                    <div style="
-                        background: rgba(30, 41, 59, 0.8);
-                        padding: 16px;
-                        border-radius: 12px;
-                        box-shadow: 0 2px 8px rgba(37, 99, 235, 0.2);
-                        border: 1px solid rgba(96, 165, 250, 0.2);
-                    ">
-                        <h4 style="color: #93c5fd; margin: 0 0 8px 0;">CHAT (Community Health Assessment Team)</h4>
-                        <p style="margin: 0 0 8px 0; color: #bfdbfe; font-weight: 500;">For youth aged 16-30</p>
-                        <p style="margin: 0; font-weight: 600; color: #60a5fa;">📞 6493-6500</p>
-                    </div>
-                    
-                    <div style="
-                        background: rgba(30, 41, 59, 0.8);
-                        padding: 16px;
-                        border-radius: 12px;
-                        box-shadow: 0 2px 8px rgba(37, 99, 235, 0.2);
-                        border: 1px solid rgba(96, 165, 250, 0.2);
-                    ">
-                        <h4 style="color: #93c5fd; margin: 0 0 8px 0;">Tinkle Friend</h4>
-                        <p style="margin: 0 0 8px 0; color: #bfdbfe; font-weight: 500;">For primary school children</p>
-                        <p style="margin: 0; font-weight: 600; color: #60a5fa;">📞 1800-274-4788</p>
-                    </div>
-                </div>
-            </div>
-
-            <div style="
-                background: linear-gradient(135deg, rgba(5, 150, 105, 0.2), rgba(52, 211, 153, 0.2));
-                padding: 24px;
-                border-radius: 16px;
-                border: 2px solid rgba(52, 211, 153, 0.3);
-                text-align: center;
-            ">
-                <div style="
-                    background: linear-gradient(135deg, {self.colors['success']}, {self.colors['accent_light']});
-                    width: 60px;
-                    height: 60px;
-                    border-radius: 50%;
-                    display: flex;
-                    align-items: center;
-                    justify-content: center;
-                    margin: 0 auto 20px auto;
-                    font-size: 24px;
-                ">💚</div>
-                <h3 style="color: #34d399;">You Are Not Alone</h3>
-                <p style="color: #a7f3d0; font-weight: 500;">Reaching out for support is a sign of strength, not weakness. Mental health professionals are trained to help you navigate difficult emotions and experiences.</p>
-            </div>
-        </div>
-        '''
+        """Return the helpline content, rendered once at import"""
+        return _HELPLINE_HTML
 
     def create_about_content(self) -> str:
-        """Create enhanced about content with readable dark mode colors"""
-        return f'''
-        <div class="soothe-content-section">
-            <h2>
-                <span style="
-                    background: linear-gradient(135deg, {self.colors['primary']}, {self.colors['primary_light']});
-                    color: white;
-                    padding: 8px 12px;
-                    border-radius: 10px;
-                    margin-right: 10px;
-                ">ℹ️</span>
-                About SootheAI
-            </h2>
-
-            <div style="
-                display: grid;
-                gap: 24px;
-                margin: 30px 0;
-            ">
-                <div style="
-                    background: linear-gradient(135deg, rgba(37, 99, 235, 0.2), rgba(29, 78, 216, 0.2));
-                    padding: 24px;
-                    border-radius: 16px;
-                    border-left: 5px solid {self.colors['primary']};
-                    border: 1px solid rgba(96, 165, 250, 0.3);
-                ">
-                    <h3 style="color: #60a5fa;">🎯 Our Mission</h3>
-                    <p style="color: #bfdbfe; font-weight: 500;">SootheAI aims to help Singaporean youths understand, manage, and overcome anxiety through interactive storytelling enhanced by artificial intelligence. We believe that by engaging young people in relatable scenarios and providing them with practical coping strategies, we can make a meaningful impact on youth mental health in Singapore.</p>
-                </div>
-
-                <div style="
-                    background: linear-gradient(135deg, rgba(5, 150, 105, 0.2), rgba(4, 120, 87, 0.2));
-                    padding: 24px;
-                    border-radius: 16px;
-                    border-left: 5px solid {self.colors['success']};
-                    border: 1px solid rgba(52, 211, 153, 0.3);
-                ">
-                    <h3 style="color: #34d399;">🤖 Our Approach</h3>
-                    <p style="color: #a7f3d0; font-weight: 500;">We combine the power of narrative storytelling with AI technology to create personalized learning experiences that adapt to each user's needs. Our stories are set in culturally relevant Singaporean contexts, addressing the unique pressures and challenges that local youth face.</p>
-                    <p style="color: #a7f3d0; font-weight: 500;">Through interactive fiction, users can explore different scenarios, make choices, and learn about anxiety management techniques in a safe, engaging environment.</p>
-                </div>
-
-                <div style="
-                    background: linear-gradient(135deg, rgba(168, 85, 247, 0.2), rgba(147, 51, 234, 0.2));
-                    padding: 24px;
-                    border-radius: 16px;
-                    border-left: 5px solid #a855f7;
-                    border: 1px solid rgba(196, 181, 253, 0.3);
-                ">
-                    <h3 style="color: #c4b5fd;">👥 The Team</h3>
-                    <p style="color: #ddd6fe; font-weight: 500;">SootheAI is developed by a team of mental health professionals, educational technologists, and AI specialists who are passionate about improving youth mental wellbeing in Singapore.</p>
-                    <p style="color: #ddd6fe; font-weight: 500;">We work closely with psychologists, educators, and youth advisors to ensure that our content is accurate, appropriate, and effective.</p>
-                </div>
-
-                <div style="
-                    background: linear-gradient(135deg, rgba(217, 119, 6, 0.2), rgba(180, 83, 9, 0.2));
-                    padding: 24px;
-                    border-radius: 16px;
-                    border-left: 5px solid {self.colors['warning']};
-                    border: 1px solid rgba(251, 191, 36, 0.3);
-                ">
-                    <h3 style="color: #fbbf24;">📧 Contact Us</h3>
-                    <p style="color: #fde68a; font-weight: 500;">If you have questions, feedback, or would like to learn more about SootheAI, please reach out to us at 
-                    <a href="mailto:contact@sootheai.sg" style="
-                        color: #60a5fa;
-                        font-weight: 600;
-                        text-decoration: none;
-                        border-bottom: 2px solid rgba(96, 165, 250, 0.3);
-                        transition: all 0.2s ease;
-                    " onmouseover="this.style.borderBottomColor = '#60a5fa'" onmouseout="this.style.borderBottomColor = 'rgba(96, 165, 250, 0.3)'">contact@sootheai.sg</a>.</p>
-                </div>
-            </div>
-
-            <div style="
-                background: linear-gradient(135deg, rgba(16, 185, 129, 0.2), rgba(37, 99, 235, 0.2));
-                padding: 24px;
-                border-radius: 16px;
-                border: 2px solid rgba(52, 211, 153, 0.3);
-                text-align: center;
-                margin-top: 30px;
-            ">
-                <h3 style="color: #34d399;">🚀 Ready to Begin?</h3>
-                <p style="color: #cbd5e1; font-weight: 500;">Start exploring anxiety management through interactive storytelling designed specifically for Singapore's youth.</p>
-                <button onclick="
-                    Array.from(document.querySelectorAll('button, .tabitem, .tab-nav button')).forEach(btn => {{
-                        if (btn.innerText.trim().includes('SootheAI Chat')) btn.click();
-                    }});
-                " style="
-                    background: linear-gradient(135deg, {self.colors['accent']}, {self.colors['accent_light']});
-                    color: white;
-                    border: none;
-                    padding: 12px 24px;
-                    border-radius: 25px;
-                    font-weight: 600;
-                    cursor: pointer;
-                    transition: all 0.3s ease;
-                    margin-top: 15px;
-                " onmouseover="this.style.transform = 'scale(1.05)'" onmouseout="this.style.transform = 'scale(1)'">
-                    Start Your Story →
-                </button>
-            </div>
-        </div>
-        '''
-    def create_enhanced_theme(self) -> gr.Theme:
+        """Return the about content, rendered once at import"""
+        return _ABOUT_HTML
+
+    def create_enhanced_theme(self) -> "gr.Theme":
+        """Return the enhanced Gradio theme, built once per interface"""
+        return self._theme
+
+    @functools.cached_property
+    def _theme(self) -> "gr.Theme":
         """Create an enhanced Gradio theme"""
+        import gradio as gr
+
         return gr.themes.Soft(
             primary_hue=gr.themes.colors.blue,
             secondary_hue=gr.themes.colors.emerald,
@@ -1358,43 +334,42 @@ SootheAI is an educational tool designed to help Singapore's youth explore anxie
                 "Inter"), "ui-sans-serif", "system-ui", "sans-serif"],
             font_mono=[gr.themes.GoogleFont(
                 "JetBrains Mono"), "Consolas", "monospace"],
-        ).set(
-            body_background_fill=f"linear-gradient(135deg, {self.colors['gradient_start']}, {self.colors['gradient_end']})",
-            background_fill_primary=self.colors['background'],
-            background_fill_secondary=self.colors['surface_alt'],
-            block_background_fill=self.colors['surface'],
-            input_background_fill=self.colors['surface'],
-            button_primary_background_fill=f"linear-gradient(135deg, {self.colors['primary']}, {self.colors['primary_light']})",
-            button_primary_background_fill_hover=f"linear-gradient(135deg, {self.colors['primary_light']}, {self.colors['primary']})",
-            button_primary_text_color="white",
-            button_secondary_background_fill=f"linear-gradient(135deg, {self.colors['accent']}, {self.colors['accent_light']})",
-            border_color_primary=self.colors['border'],
-            border_color_accent=self.colors['border_focus'],
-            body_text_color=self.colors['text_secondary'],
-            body_text_color_subdued=self.colors['text_muted'],
-        )
-
-    def main_loop(self, message: Optional[str], history: List[Tuple[str, str]]) -> str:
-        """Main game loop with enhanced error handling"""
+        ).set(**_THEME_OVERRIDES)
+
+    def main_loop(self, message: Optional[str], history: List[Dict[str, str]],
+                  on_text: Optional[Callable[[str], None]] = None) -> str:
+        """Main game loop with enhanced error handling; on_text receives story text as it streams"""
         if message is None:
             logger.info("Processing empty message in main loop")
             return self.consent_message
 
-        logger.info(
-            f"Processing message: {message[:50] if message else ''}...")
+        logger.info("Processing message: %.50s...", message)
+
+        # Speak story turns sentence by sentence while Claude is still writing them
+        narration = None
+        if message.lower() not in _NO_NARRATION_MESSAGES:
+            narration = self.tts_handler.start_narration(filter_response_safety)
+
+        def on_delta(delta: str) -> None:
+            if narration:
+                narration.feed(delta)
+            if on_text:
+                on_text(delta)
 
         try:
-            response, success = self.narrative_engine.process_message(message)
+            response, success = self.narrative_engine.process_message(
+                message, on_delta=on_delta if narration or on_text else None)
 
             if not success:
                 logger.error(f"Narrative engine error: {response}")
                 return "🤖 I apologize, but I encountered an error. Please try again or contact support if the issue persists."
 
-            # TTS integration
-            if (success and
-                hasattr(self.narrative_engine, 'game_state') and
-                self.narrative_engine.game_state.is_consent_given() and
-                    message.lower() not in ['i agree', 'i agree with audio', 'i agree without audio', 'enable audio', 'disable audio', 'start game']):
+            # TTS integration for replies that were not already narrated while streaming
+            game_state = getattr(self.narrative_engine, 'game_state', None)
+            if (not (narration and narration.started) and
+                game_state is not None and
+                game_state.is_consent_given() and
+                    message.lower() not in _NO_NARRATION_MESSAGES):
 
                 try:
                     self.tts_handler.run_tts_with_consent_and_limiting(
@@ -1408,28 +383,76 @@ SootheAI is an educational tool designed to help Singapore's youth explore anxie
             logger.error(f"Error in main loop: {str(e)}")
             return "🤖 I apologize, but I encountered an unexpected error. Please try again or refresh the page if the issue continues."
 
-    def create_interface(self) -> gr.Blocks:
+        finally:
+            if narration:
+                narration.close()  # Flush the last partial sentence
+
+    async def chat(self, message: Optional[str], history: List[Dict[str, str]]) -> AsyncIterator[str]:
+        """Async chat handler that streams the reply while main_loop runs in a worker thread"""
+        loop = asyncio.get_running_loop()
+        deltas: asyncio.Queue = asyncio.Queue()
+
+        def on_text(delta: Optional[str]) -> None:
+            loop.call_soon_threadsafe(deltas.put_nowait, delta)
+
+        def run() -> str:
+            try:
+                return self.main_loop(message, history, on_text)
+            finally:
+                on_text(None)  # Sentinel: no more text is coming
+
+        reply = asyncio.ensure_future(asyncio.to_thread(run))
+
+        # Show the story as it is written, filtered like the final reply
+        partial = ""
+        done = False
+        last_flush = 0.0  # The first text is shown immediately
+        while not done:
+            pending = [await deltas.get()]
+            # Small fragments wait out the flush interval so more text can join them
+            if pending[0] is not None and len(pending[0]) < _STREAM_BUFFER_CHARS:
+                wait = last_flush + _STREAM_FLUSH_INTERVAL - loop.time()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+            # Fold every delta that arrived meanwhile into one update (one event, one safety pass)
+            while not deltas.empty():
+                pending.append(deltas.get_nowait())
+            if pending[-1] is None:
+                done = True
+                pending.pop()
+            if pending:
+                partial += "".join(pending)
+                last_flush = loop.time()
+                yield filter_response_safety(partial)
+
+        yield await reply
+
+    def create_interface(self) -> "gr.Blocks":
         """Create the enhanced Gradio interface with professional chatbot design"""
+        import gradio as gr
+
         with gr.Blocks(
             theme=self.create_enhanced_theme(),
             title="SootheAI - Mental Health Support for Singapore's Youth",
-            css=self.create_enhanced_css()
+            css=self.create_enhanced_css(),
+            head=_CARDS_CSS_HEAD + _TAB_LINK_SCRIPT
         ) as blocks:
 
             with gr.Tabs(elem_classes="soothe-tabs") as tabs:
                 with gr.Tab("🏠 Home"):
                     gr.HTML(self.create_enhanced_homepage())
 
-                with gr.Tab("💬 SootheAI Chat", elem_classes="chat-tab"):
+                with gr.Tab("💬 SootheAI Chat", elem_id="sootheai-chat-tab", elem_classes="chat-tab"):
                     # Professional chatbot interface with minimal parameters
                     chat_interface = gr.ChatInterface(
-                        fn=self.main_loop,
+                        fn=self.chat,
                         chatbot=gr.Chatbot(
                             height="65vh",
                             placeholder="🌸 **Welcome to your safe space!** Your supportive conversation will begin here. Take your time and start when you're ready.",
                             show_copy_button=True,
                             render_markdown=True,
-                            value=[[None, self.consent_message]],
+                            value=[{"role": "assistant", "content": self.consent_message}],
+                            type="messages",
                             elem_classes="soothe-chatbot",
                         ),
                         textbox=gr.Textbox(
@@ -1448,30 +471,47 @@ SootheAI is an educational tool designed to help Singapore's youth explore anxie
                             "🤝 What coping strategies can you teach me?"
                         ],
                         cache_examples=False,
+                        type="messages",
                     )
 
-                with gr.Tab("📚 Learn About Anxiety"):
-                    gr.HTML(self.create_anxiety_education_content())
+                # Only the homepage ships with the page; the info tabs load when first opened
+                with gr.Tab("📚 Learn About Anxiety") as education_tab:
+                    _fill_on_first_select(education_tab, self.create_anxiety_education_content())
+
+                with gr.Tab("🆘 Get Help") as help_tab:
+                    _fill_on_first_select(help_tab, self.create_helpline_content())
 
-                with gr.Tab("🆘 Get Help"):
-                    gr.HTML(self.create_helpline_content())
+                with gr.Tab("ℹ️ About") as about_tab:
+                    _fill_on_first_select(about_tab, self.create_about_content())
 
-                with gr.Tab("ℹ️ About"):
-                    gr.HTML(self.create_about_content())
+        blocks.queue(default_concurrency_limit=_CHAT_CONCURRENCY_LIMIT)
 
         self.interface = blocks
         return blocks
 
     def launch(self, share: bool = True, server_name: str = "0.0.0.0", server_port: int = 7861) -> None:
         """Launch the enhanced interface"""
+        # Fail before building the UI or starting the TTS prewarm thread
+        if not 0 < server_port < 65536:
+            raise ValueError(f"Invalid server port: {server_port}")
+
         if self.interface is None:
             self.create_interface()
+
+        # Open the ElevenLabs connection while the server boots, not on the first reply
+        threading.Thread(target=self.tts_handler.prewarm, daemon=True).start()
+
         try:
             logger.info("Launching enhanced SootheAI interface...")
             self.interface.launch(
                 share=share,
                 server_name=server_name,
-                server_port=server_port
+                server_port=server_port,
+                # Page, config and tab-select payloads carry inline HTML, so compress them
+                app_kwargs={
+                    "middleware": [_page_compression_middleware()],
+                    "routes": [_cards_css_route()],
+                }
             )
         except Exception as e:
             logger.error(f"Failed to launch Gradio interface: {str(e)}")
@@ -1498,3 +538,29 @@ def create_gradio_interface(elevenlabs_client=None) -> GradioInterface:
         GradioInterface: Configured interface instance ready for launch
     """
     return GradioInterface(elevenlabs_client)
+
+
+# Singleton instance so every caller shares one built Blocks app and its clients
+_gradio_interface = None
+_gradio_interface_lock = threading.Lock()
+
+
+def get_gradio_interface(elevenlabs_client=None) -> GradioInterface:
+    """
+    Get the shared Gradio interface, creating it on first use.
+
+    Args:
+        elevenlabs_client: Optional ElevenLabs client, only used when the interface is first created
+
+    Returns:
+        GradioInterface: Singleton interface instance
+    """
+    global _gradio_interface
+
+    if _gradio_interface is None:
+        with _gradio_interface_lock:
+            # Re-check inside the lock in case another thread created it first
+            if _gradio_interface is None:
+                _gradio_interface = GradioInterface(elevenlabs_client)
+
+    return _gradio_interface
@@ -8,9 +8,10 @@ import logging  # For application logging
 import threading  # For non-blocking TTS processing
 import subprocess  # For ffplay audio playback
 import re  # For pattern matching in content detection
+import queue  # For handing streamed text to the narration thread
 from collections import deque  # For efficient request tracking
 # Type hints for better code documentation
-from typing import Optional, Tuple, Dict
+from typing import Optional, Tuple, Dict, Callable, Iterable, Iterator
 
 # Import audit trail for TTS usage tracking
 from .speech_audit_trail import get_audit_trail
@@ -18,6 +19,51 @@ from .speech_audit_trail import get_audit_trail
 # Set up logger for this module
 logger = logging.getLogger(__name__)
 
+# Sentence end: terminal punctuation followed by whitespace (decimals like 3.5 never match)
+_SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?])\s+')
+# Abbreviations whose trailing period must not end a sentence
+_ABBREVIATIONS = frozenset(
+    ("dr.", "mr.", "mrs.", "ms.", "prof.", "st.", "vs.", "etc.", "e.g.", "i.e."))
+# Fragments shorter than this are held back and joined to the next sentence
+_MIN_SENTENCE_CHARS = 10
+# Messages process_command acts on; anything else skips the command checks
+_TTS_COMMANDS = frozenset((
+    'enable audio', 'disable audio', 'no audio', 'i agree with audio',
+    'i agree without audio', 'tts status', 'tts report',
+))
+# Every command mentions audio or tts, so one scan rules out ordinary story input without copying it
+_TTS_TRIGGER = re.compile(r'audio|tts', re.IGNORECASE)
+
+
+def _sentence_buffer(chunks: Iterable[str]) -> Iterator[str]:
+    """
+    Regroup streamed text chunks into complete sentences.
+
+    Args:
+        chunks: Text deltas in arrival order
+
+    Yields:
+        str: Each complete sentence, followed by any trailing remainder
+    """
+    buffer = ""
+    for chunk in chunks:
+        buffer += chunk
+        cut = 0  # Start of the sentence currently being built
+        for match in _SENTENCE_BOUNDARY.finditer(buffer):
+            sentence = buffer[cut:match.start()].strip()
+            last_word = sentence.rsplit(None, 1)[-1].lower() if sentence else ""
+            # Keep building if this is a short fragment or an abbreviation
+            if len(sentence) < _MIN_SENTENCE_CHARS or last_word in _ABBREVIATIONS:
+                continue
+            yield sentence
+            cut = match.end()
+        buffer = buffer[cut:]  # Carry the unfinished sentence into the next chunk
+
+    # Flush whatever is left once the stream ends
+    remainder = buffer.strip()
+    if remainder:
+        yield remainder
+
 
 class TTSRateLimiter:
     """Rate limiter for text-to-speech requests to prevent API abuse."""
@@ -87,6 +133,23 @@ class TTSRateLimiter:
 
         return True, ""  # Request approved
 
+    def add_streamed_chars(self, text: str) -> Tuple[bool, str]:
+        """
+        Count text spoken later in an already approved streaming request.
+
+        Args:
+            text: Text about to be converted to speech
+
+        Returns:
+            Tuple[bool, str]: (can_process, reason_if_rejected)
+        """
+        # Check daily character limit only; the request itself was already counted
+        if self.total_chars_today + len(text) > self.daily_char_limit:
+            return False, "Daily audio limit reached. Audio will resume tomorrow."
+
+        self.total_chars_today += len(text)  # Add characters to daily count
+        return True, ""
+
     def get_status(self) -> dict:
         """
         Get current rate limiter status for monitoring.
@@ -197,7 +260,12 @@ class TTSHandler:
         self.tts_session_started = False  # Track if TTS session has started
         # Default female voice ID for ElevenLabs
         self.voice_id = "21m00Tcm4TlvDq8ikWAM"
-        self.model_id = "eleven_flash_v2_5"  # Fast model for real-time synthesis
+        # Low-latency model; this replaces the deprecated optimize_streaming_latency flag,
+        # which must not be passed alongside it
+        self.model_id = "eleven_flash_v2_5"
+        # Raw PCM streams straight into ffplay with no MP3 decode step before first audio
+        self.output_format = "pcm_22050"
+        self.sample_rate = 22050  # Must match the sample rate in output_format
 
         # Get the audit trail instance for usage tracking
         self.audit_trail = get_audit_trail()
@@ -227,6 +295,18 @@ class TTSHandler:
         else:
             return text  # Return original text if session already started
 
+    def prewarm(self) -> None:
+        """Fetch the narration voice's metadata so the first synthesis reuses an open connection."""
+        if not self.elevenlabs_client:  # Nothing to warm without a client
+            return
+
+        try:
+            self.elevenlabs_client.voices.get(self.voice_id)  # Free call; opens the TLS connection
+            logger.info("TTS connection prewarmed")
+        except Exception as e:
+            # Warm-up is best effort; the first synthesis will simply connect itself
+            logger.warning(f"TTS prewarm failed: {e}")
+
     def mark_tts_session_started(self) -> None:
         """Mark TTS session as started for tracking purposes."""
         self.tts_session_started = True  # Set session started flag
@@ -257,13 +337,28 @@ class TTSHandler:
         # Default to narrative content
         return "narrative"
 
-    def speak_text(self, text: str, category: str = "narrative") -> None:
+    def _open_player(self) -> subprocess.Popen:
+        """Start ffplay reading raw 16-bit mono PCM from stdin."""
+        return subprocess.Popen(
+            ["ffplay", "-nodisp", "-autoexit", "-loglevel", "quiet",
+             "-f", "s16le", "-sample_rate", str(self.sample_rate), "-"],
+            stdin=subprocess.PIPE,  # Accept audio data via stdin
+            stdout=subprocess.DEVNULL,  # Suppress stdout
+            stderr=subprocess.DEVNULL  # Suppress stderr
+        )
+
+    def speak_text(self, text: str, category: str = "narrative",
+                   previous_text: Optional[str] = None,
+                   player: Optional[subprocess.Popen] = None) -> None:
         """
         Stream text to speech using ElevenLabs API and play with ffmpeg.
 
         Args:
             text: Text to convert to speech
             category: Category of speech content for audit logging
+            previous_text: Text spoken just before this, so prosody carries across sentences
+            player: Open ffplay process to append the audio to; when None a new one is
+                    started and this call waits for playback to finish
         """
         if not self.elevenlabs_client:  # Check if TTS client is available
             # Log disabled TTS
@@ -287,35 +382,37 @@ class TTSHandler:
                 category=category,  # Content category
                 metadata={
                     "voice_id": self.voice_id,  # Voice model used
-                    "model_id": self.model_id  # TTS model used
+                    "model_id": self.model_id,  # TTS model used
+                    "output_format": self.output_format  # Audio format streamed
                 }
             )
 
-            # Start ffplay process for audio playback
-            process = subprocess.Popen(
-                ["ffplay", "-nodisp", "-autoexit", "-loglevel", "quiet", "-"],
-                stdin=subprocess.PIPE,  # Accept audio data via stdin
-                stdout=subprocess.DEVNULL,  # Suppress stdout
-                stderr=subprocess.DEVNULL  # Suppress stderr
-            )
+            # Start ffplay for raw 16-bit mono PCM playback unless the caller shares one
+            process = player or self._open_player()
+
+            # Only send previous_text when narrating a multi-sentence stream
+            context = {"previous_text": previous_text} if previous_text else {}
 
             # Use the correct ElevenLabs streaming method
             audio_stream = self.elevenlabs_client.text_to_speech.stream(
                 voice_id=self.voice_id,  # Voice to use
-                output_format="mp3_44100_128",  # Audio format specification
+                output_format=self.output_format,  # Raw PCM for lowest time-to-first-audio
                 text=text,  # Text to synthesize
-                model_id=self.model_id  # Model to use
+                model_id=self.model_id,  # Model to use
+                **context
             )
 
             # Stream audio data to ffplay
             for chunk in audio_stream:
                 if process.stdin:  # Ensure stdin is available
                     process.stdin.write(chunk)  # Write audio chunk to ffplay
-            
-            if process.stdin:
-                process.stdin.close()  # Close stdin when done
 
-            process.wait()  # Wait for ffplay to finish
+            # A shared player keeps playing while the caller synthesizes the next text
+            if player is None:
+                if process.stdin:
+                    process.stdin.close()  # Close stdin when done
+
+                process.wait()  # Wait for ffplay to finish
             stream_elapsed = time.time() - stream_start  # Calculate processing time
             logger.info(f"[DEBUG] TTS streaming duration: {stream_elapsed:.2f} seconds")
 
@@ -399,6 +496,26 @@ class TTSHandler:
         # Log thread start
         logger.info(f"Started TTS thread for text: {text[:50]}...")
 
+    def start_narration(self, sentence_filter: Optional[Callable[[str], str]] = None) -> Optional["NarrationStream"]:
+        """
+        Open a narration stream that speaks a reply sentence by sentence as it generates.
+
+        Args:
+            sentence_filter: Optional safety filter applied to each sentence before synthesis
+
+        Returns:
+            NarrationStream or None if TTS is disabled or consent is not given
+        """
+        if not self.elevenlabs_client:
+            logger.debug("TTS is disabled: ElevenLabs client not initialized")
+            return None
+
+        if not self.consent_manager.is_consent_given():
+            logger.debug("TTS skipped: Voice consent not given")
+            return None
+
+        return NarrationStream(self, sentence_filter)
+
     def process_command(self, message: str) -> Tuple[bool, Optional[str]]:
         """
         Process potential TTS-related commands from user input.
@@ -409,8 +526,13 @@ class TTSHandler:
         Returns:
             Tuple[bool, Optional[str]]: (is_tts_command, response_message)
         """
+        if _TTS_TRIGGER.search(message) is None:  # Cheap pre-check before normalizing a long message
+            return False, None
+
         # Check for voice consent commands
         message_lower = message.lower().strip()  # Normalize message for comparison
+        if message_lower not in _TTS_COMMANDS:  # Most chat turns are story input, not commands
+            return False, None
 
         # Handle audio enable command
         if message_lower == 'enable audio':
@@ -485,6 +607,84 @@ class TTSHandler:
         return False, None  # Not a TTS command
 
 
+class NarrationStream:
+    """Speaks a streamed reply one sentence at a time while the rest is still generating."""
+
+    def __init__(self, tts_handler: TTSHandler, sentence_filter: Optional[Callable[[str], str]] = None):
+        """
+        Initialize the narration stream.
+
+        Args:
+            tts_handler: Handler used for rate limiting, audit and playback
+            sentence_filter: Optional safety filter applied to each sentence
+        """
+        self.tts_handler = tts_handler
+        self.sentence_filter = sentence_filter
+        self.started = False  # True once the first text delta has arrived
+        self._deltas = queue.Queue()  # Text deltas waiting for the narration thread
+        self._thread = threading.Thread(target=self._narrate, daemon=True)
+
+    def feed(self, delta: str) -> None:
+        """
+        Queue a text delta from the LLM stream.
+
+        Args:
+            delta: Newly generated text
+        """
+        if not self.started:
+            self.started = True
+            self._thread.start()  # Start speaking as soon as text arrives
+        self._deltas.put(delta)
+
+    def close(self) -> None:
+        """Signal the end of the stream so the last partial sentence is spoken."""
+        if self.started:
+            self._deltas.put(None)
+
+    def _narrate(self) -> None:
+        """Group deltas into sentences and speak them in order through one player."""
+        handler = self.tts_handler
+        previous_sentence = None
+        player = None  # Shared ffplay, so each sentence is synthesized while the last one plays
+        try:
+            for sentence in _sentence_buffer(iter(self._deltas.get, None)):
+                if self.sentence_filter:
+                    sentence = self.sentence_filter(sentence)
+
+                # The whole reply counts as one request; later sentences only add characters
+                if previous_sentence is None:
+                    can_process, limit_message = handler.rate_limiter.can_process_tts(sentence)
+                else:
+                    can_process, limit_message = handler.rate_limiter.add_streamed_chars(sentence)
+                if not can_process:
+                    logger.warning(f"TTS rate limited: {limit_message}")
+                    handler.audit_trail.log_synthesis_error(
+                        text=sentence[:100] + "..." if len(sentence) > 100 else sentence,
+                        error_message=f"Rate limiting: {limit_message}",
+                        category="rate_limited"
+                    )
+                    break
+
+                if player is None:
+                    try:
+                        player = handler._open_player()
+                    except OSError as e:
+                        logger.error(f"Could not start audio player: {e}")
+                        break
+                category = handler.detect_content_category(sentence)
+                handler.speak_text(handler.add_voice_disclaimer(sentence), category,
+                                   previous_text=previous_sentence, player=player)
+                previous_sentence = sentence
+        finally:
+            if player is not None:
+                try:
+                    if player.stdin:
+                        player.stdin.close()  # End of input; ffplay exits after the last sample
+                    player.wait()
+                except Exception as e:
+                    logger.error(f"Error closing narration player: {e}")
+
+
 # Singleton instance for application-wide access
 _tts_handler = None
 
@@ -0,0 +1,81 @@
+"""
+Shared HTTP client for SootheAI.
+Gives the Claude and ElevenLabs SDKs one pooled set of keep-alive connections.
+"""
+
+import atexit  # For closing pooled connections on application exit
+import logging  # For application logging
+import threading  # Guards singleton creation across threads
+# Type hints for better code documentation
+from typing import TYPE_CHECKING, Optional
+
+# httpx pulls in a sizeable dependency tree, so it is loaded when the client is first created
+if TYPE_CHECKING:
+    import httpx
+
+# Set up logger for this module
+logger = logging.getLogger(__name__)
+
+# HTTP/2 needs the optional h2 package; fall back to HTTP/1.1 keep-alive without it
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True  # Flag indicating HTTP/2 can be negotiated
+except ImportError:
+    HTTP2_AVAILABLE = False  # Connections are pooled over HTTP/1.1 only
+
+# Connection pool sizing shared by all outbound API calls
+_MAX_CONNECTIONS = 32
+_MAX_KEEPALIVE_CONNECTIONS = 16
+# SDKs pass their own per-request timeouts; this only applies to bare requests
+_DEFAULT_TIMEOUT_SECONDS = 60.0
+_CONNECT_TIMEOUT_SECONDS = 10.0
+
+# Singleton instance for application-wide access
+_http_client: Optional["httpx.Client"] = None
+_http_client_lock = threading.Lock()
+
+
+def get_http_client() -> "httpx.Client":
+    """
+    Get the shared HTTP client, creating it on first use.
+
+    Returns:
+        httpx.Client: Pooled client reused for every Claude and ElevenLabs request
+
+    Example:
+        >>> client = anthropic.Anthropic(api_key=key, http_client=get_http_client())
+    """
+    global _http_client
+
+    if _http_client is None:
+        with _http_client_lock:
+            # Re-check inside the lock in case another thread created it first
+            if _http_client is None:
+                import httpx  # HTTP client used underneath both SDKs
+                _http_client = httpx.Client(
+                    http2=HTTP2_AVAILABLE,
+                    limits=httpx.Limits(max_connections=_MAX_CONNECTIONS,
+                                        max_keepalive_connections=_MAX_KEEPALIVE_CONNECTIONS),
+                    timeout=httpx.Timeout(_DEFAULT_TIMEOUT_SECONDS, connect=_CONNECT_TIMEOUT_SECONDS)
+                )
+                logger.info(
+                    f"Shared HTTP client created (HTTP/2 {'enabled' if HTTP2_AVAILABLE else 'unavailable'})")
+
+    return _http_client
+
+
+def close_http_client() -> None:
+    """Close the shared HTTP client and release its pooled connections."""
+    global _http_client
+
+    if _http_client is not None:
+        try:
+            _http_client.close()  # Close keep-alive connections
+            logger.info("Shared HTTP client closed")
+        except Exception as e:
+            logger.error(f"Error closing shared HTTP client: {e}")
+        _http_client = None
+
+
+# Register cleanup function for application exit
+atexit.register(close_http_client)
@@ -0,0 +1,37 @@
+"""
+Minification helpers for SootheAI's UI assets.
+Used once at import time by the Gradio and Streamlit interfaces.
+"""
+
+import re  # Fallback minifiers are regex based
+
+# Optional CSS minifier; a conservative whitespace/comment stripper is used without it
+try:
+    import csscompressor
+    CSS_COMPRESSOR_AVAILABLE = True
+except ImportError:
+    CSS_COMPRESSOR_AVAILABLE = False
+
+# Optional HTML minifier; runs of whitespace are collapsed without it
+try:
+    import minify_html as _minify_html
+    MINIFY_HTML_AVAILABLE = True
+except ImportError:
+    MINIFY_HTML_AVAILABLE = False
+
+
+def minify_css(css: str) -> str:
+    """Minify CSS with csscompressor, or strip comments and redundant whitespace"""
+    if CSS_COMPRESSOR_AVAILABLE:
+        return csscompressor.compress(css)
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.DOTALL)  # Comments
+    css = re.sub(r"\s+", " ", css)  # Runs of whitespace
+    css = re.sub(r"\s*([{};,>])\s*", r"\1", css)  # Spaces around punctuation
+    return css.replace(";}", "}").strip()
+
+
+def minify_html(html: str) -> str:
+    """Minify page HTML with minify-html, or collapse runs of whitespace"""
+    if MINIFY_HTML_AVAILABLE:
+        return _minify_html.minify(html, minify_css=True, minify_js=True, keep_comments=False)
+    return re.sub(r"\s+", " ", html).strip()
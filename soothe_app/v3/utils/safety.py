@@ -5,6 +5,7 @@ Handles content filtering and safety checks.
 
 import logging  # For application logging
 import re  # For regular expression pattern matching
+import string  # For ASCII letter tables used by the fast lowercase path
 # Type hints for better code documentation
 from typing import Tuple, List, Optional, Dict, Any
 
@@ -20,16 +21,42 @@ try:
         SeverityLevel          # Severity levels for content violations
     )
     ENHANCED_FILTER_AVAILABLE = True  # Flag indicating enhanced filter is available
+    # Severities that warrant a safety disclaimer, built once for O(1) membership checks
+    _HIGH_OR_CRITICAL = frozenset((SeverityLevel.HIGH, SeverityLevel.CRITICAL))
     # Log successful import
     logger.info("Enhanced content filter imported successfully")
 except ImportError:
     ENHANCED_FILTER_AVAILABLE = False  # Enhanced filter not available
+    _HIGH_OR_CRITICAL = frozenset()  # No severity levels without the enhanced filter
     logger.warning(
         "Enhanced content filter not available, using basic filtering")  # Log fallback to basic filtering
 
 # Initialize content filter instance
 _content_filter = None
 
+# Translation table mapping ASCII uppercase to lowercase, built once at import
+_ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+# Critical harmful patterns for the basic filter, compiled once at import
+_CRITICAL_PATTERNS = (
+    # Suicide ideation patterns
+    r'\b(?:kill|comm?it).{0,20}(?:suicide|myself)\b',
+    # Life-ending expressions
+    r'\b(?:end|take).{0,20}(?:my|own).{0,20}life\b',
+    # Direct suicide references
+    r'\bsuicid(?:e|al)\b',
+    # Self-harm patterns
+    r'\b(?:hurt|harm|cut|slash).{0,20}(?:myself|arms|wrists)\b',
+    # Death method seeking
+    r'\bways to d(?:ie|eath)\b'
+)
+
+# Named-group alternation so one re scan also reports which pattern matched
+_CRITICAL_REGEX = re.compile(
+    "|".join(f"(?P<p{i}>{p})" for i, p in enumerate(_CRITICAL_PATTERNS)),
+    re.IGNORECASE
+)
+
 
 def initialize_content_filter() -> bool:
     """
@@ -171,7 +198,7 @@ def filter_response_safety(response: str) -> str:
             filtered_response = result.filtered_text
 
             # Add safety notice for high severity content
-            high_severity = any(match.severity in [SeverityLevel.HIGH, SeverityLevel.CRITICAL]
+            high_severity = any(match.severity in _HIGH_OR_CRITICAL
                                 for match in result.matches)  # Check for high severity violations
             if high_severity:
                 filtered_response += "\n\n" + _get_safety_disclaimer()  # Append safety disclaimer
@@ -181,6 +208,45 @@ def filter_response_safety(response: str) -> str:
     return response  # Return original response if no violations
 
 
+def _fast_ascii_lower(text: str) -> str:
+    """
+    Lowercase text, using a plain ASCII translation table for ASCII-only input.
+
+    The harmful-pattern lists are English-only, so for pure-ASCII text a
+    table lookup gives the same result as str.lower() without going through
+    the full Unicode case mapping. Non-ASCII text falls back to str.lower().
+
+    Args:
+        text: Text to lowercase
+
+    Returns:
+        str: Lowercased text
+
+    Example:
+        >>> _fast_ascii_lower("I Want To End My Life")
+        'i want to end my life'
+    """
+    if text.isascii():  # Cheap C-level check for the common English-only case
+        return text.translate(_ASCII_LOWER)  # Table-driven ASCII lowercase
+    return text.lower()  # Full Unicode lowercase for everything else
+
+
+def _match_critical_pattern(text: str) -> Optional[str]:
+    """
+    Find the first critical pattern present in text.
+
+    Args:
+        text: Lowercased text to scan
+
+    Returns:
+        Optional[str]: The matching pattern, or None if no pattern matched
+    """
+    match = _CRITICAL_REGEX.search(text)  # Single pass over the combined alternation
+    if match is None:
+        return None
+    return _CRITICAL_PATTERNS[int(match.lastgroup[1:])]
+
+
 def _basic_safety_check(message: str) -> Tuple[bool, str]:
     """
     Basic safety check for when enhanced filter is not available.
@@ -195,39 +261,25 @@ def _basic_safety_check(message: str) -> Tuple[bool, str]:
         >>> is_safe, response = _basic_safety_check("I want to end my life")
         >>> print(f"Safe: {is_safe}")  # Safe: False
     """
-    # List of critical harmful patterns using regex
-    critical_patterns = [
-        # Suicide ideation patterns
-        r'\b(?:kill|comm?it).{0,20}(?:suicide|myself)\b',
-        # Life-ending expressions
-        r'\b(?:end|take).{0,20}(?:my|own).{0,20}life\b',
-        # Direct suicide references
-        r'\bsuicid(?:e|al)\b',
-        # Self-harm patterns
-        r'\b(?:hurt|harm|cut|slash).{0,20}(?:myself|arms|wrists)\b',
-        # Death method seeking
-        r'\bways to d(?:ie|eath)\b'
-    ]
-
     # Convert to lowercase for case-insensitive matching
-    message_lower = message.lower()
-
-    # Check for critical patterns using regex
-    for pattern in critical_patterns:
-        if re.search(pattern, message_lower, re.IGNORECASE):  # Case-insensitive pattern search
-            logger.warning(
-                f"Basic filter detected potentially harmful content: {pattern}")  # Log pattern match
-            # Provide comprehensive safety message with resources
-            safety_message = (
-                "I notice your message contains concerning content. "
-                "If you're experiencing difficult thoughts, please reach out for support. "
-                "\n\n**Available Resources:**\n"
-                "- National Care Hotline (Singapore): 1800-202-6868\n"
-                "- Samaritans of Singapore (SOS): 1-767\n"
-                "- IMH Mental Health Helpline: 6389-2222\n\n"
-                "For the purposes of this story, let's explore healthier approaches."
-            )
-            return False, safety_message  # Return unsafe with safety resources
+    message_lower = _fast_ascii_lower(message)
+
+    # Check for critical patterns in a single pass over the message
+    pattern = _match_critical_pattern(message_lower)
+    if pattern is not None:
+        logger.warning(
+            f"Basic filter detected potentially harmful content: {pattern}")  # Log pattern match
+        # Provide comprehensive safety message with resources
+        safety_message = (
+            "I notice your message contains concerning content. "
+            "If you're experiencing difficult thoughts, please reach out for support. "
+            "\n\n**Available Resources:**\n"
+            "- National Care Hotline (Singapore): 1800-202-6868\n"
+            "- Samaritans of Singapore (SOS): 1-767\n"
+            "- IMH Mental Health Helpline: 6389-2222\n\n"
+            "For the purposes of this story, let's explore healthier approaches."
+        )
+        return False, safety_message  # Return unsafe with safety resources
 
     return True, message  # Return safe with original message
 
@@ -265,7 +317,8 @@ def log_content_analysis_metrics(result: Any, text_type: str) -> None:
     if not ENHANCED_FILTER_AVAILABLE:  # Skip if enhanced filter not available
         return
 
-    if not hasattr(result, 'has_violations'):  # Validate result object
+    has_violations = getattr(result, 'has_violations', None)  # Validate result object
+    if has_violations is None:
         logger.warning(
             f"Cannot log metrics for {text_type}: Invalid result object")  # Log invalid result
         return
@@ -273,21 +326,26 @@ def log_content_analysis_metrics(result: Any, text_type: str) -> None:
     # Log comprehensive analysis metrics
     logger.info(f"Content analysis [{text_type}]:")  # Log analysis type
     # Log violation status
-    logger.info(f"  - Has violations: {result.has_violations}")
+    logger.info(f"  - Has violations: {has_violations}")
 
-    if hasattr(result, 'severity_score'):  # Log severity if available
-        logger.info(f"  - Severity score: {result.severity_score}")
+    # Read each optional attribute once instead of hasattr() followed by a second lookup
+    severity_score = getattr(result, 'severity_score', None)
+    if severity_score is not None:  # Log severity if available
+        logger.info(f"  - Severity score: {severity_score}")
 
-    if hasattr(result, 'processing_time'):  # Log processing performance if available
+    processing_time = getattr(result, 'processing_time', None)
+    if processing_time is not None:  # Log processing performance if available
         logger.info(
-            f"  - Processing time: {result.processing_time*1000:.2f}ms")
+            f"  - Processing time: {processing_time*1000:.2f}ms")
 
-    if hasattr(result, 'categories_violated'):  # Log violated categories if available
-        logger.info(f"  - Categories violated: {result.categories_violated}")
+    categories_violated = getattr(result, 'categories_violated', None)
+    if categories_violated is not None:  # Log violated categories if available
+        logger.info(f"  - Categories violated: {categories_violated}")
 
     # Log detailed match information for debugging
-    if result.has_violations and hasattr(result, 'matches'):
-        for match in result.matches:  # Iterate through individual matches
+    matches = getattr(result, 'matches', None) if has_violations else None
+    if matches:
+        for match in matches:  # Iterate through individual matches
             logger.debug(
                 f"  - Match: {match.phrase} (Severity: {match.severity.name}, Category: {match.category})"
             )